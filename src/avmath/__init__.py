@@ -21,7 +21,7 @@ __author__ = "Camillo Ballandt"
 __version__ = "3.2.0alpha1"
 __date__ = "2022/04/03"
 
-__all__ = ["Fraction", "CFraction",
+__all__ = ["Fraction", "CFraction", "Dual",
            "sin", "cos", "tan",
            "arcsin", "arccos", "arctan",
            "sinh", "cosh", "tanh",
@@ -153,10 +153,10 @@ class Fraction:
             reduced_self = self.reduce()
             reduced_other = other.reduce()
             factor = lcm(reduced_self.b, reduced_other.b)
-            summand1 = Fraction(reduced_self.a*int(factor/reduced_self.b),
-                                reduced_self.b*int(factor/reduced_self.b))
-            summand2 = Fraction(reduced_other.a*int(factor/reduced_other.b),
-                                reduced_other.b*int(factor/reduced_other.b))
+            summand1 = Fraction(reduced_self.a*(factor // reduced_self.b),
+                                reduced_self.b*(factor // reduced_self.b))
+            summand2 = Fraction(reduced_other.a*(factor // reduced_other.b),
+                                reduced_other.b*(factor // reduced_other.b))
             return Fraction(summand1.a + summand2.a, summand1.b)
 
     __radd__ = __add__
@@ -223,7 +223,7 @@ class Fraction:
 
     def reduce(self) -> 'Fraction':
         divisor = gcd(self.a, self.b)
-        return Fraction(int(self.a / divisor), int(self.b / divisor))
+        return Fraction(int(self.a // divisor), int(self.b // divisor))
 
     def int_args(self) -> bool:
         return type(self.a) == int and type(self.b) == int
@@ -330,6 +330,130 @@ class CFraction:
         return CFraction(real=self.real, imag=-self.imag)
 
 
+class Dual:
+    """Number with first and second derivative for automatic
+    differentiation. Insert
+    f(Dual(x, 1))
+    for
+    f(x), f'(x) and f''(x)
+    in one calculation. Arithmetic operations and the functions of
+    avmath apply the chain rule.
+    """
+
+    __slots__ = ("value", "first", "second")
+
+    def __init__(self, value, first=0, second=0):
+        self.value = value
+        self.first = first
+        self.second = second
+
+    def __repr__(self):
+        return f"Dual({self.value}, {self.first}, {self.second})"
+
+    def _chain(self, value, first, second) -> 'Dual':
+        """Returns g(self) for g(u) = value, g'(u) = first and
+        g''(u) = second.
+        """
+        return Dual(value, first * self.first,
+                    second * self.first ** 2 + first * self.second)
+
+    def __eq__(self, other) -> bool:
+        """Compares the values."""
+        if type(other) == Dual:
+            return self.value == other.value
+        return self.value == other
+
+    def __lt__(self, other) -> bool:
+        if type(other) == Dual:
+            return self.value < other.value
+        return self.value < other
+
+    def __gt__(self, other) -> bool:
+        if type(other) == Dual:
+            return self.value > other.value
+        return self.value > other
+
+    def __le__(self, other) -> bool:
+        return not self > other
+
+    def __ge__(self, other) -> bool:
+        return not self < other
+
+    def __neg__(self) -> 'Dual':
+        return Dual(-self.value, -self.first, -self.second)
+
+    def __pos__(self) -> 'Dual':
+        return self
+
+    def __abs__(self) -> 'Dual':
+        return self._chain(abs(self.value), sgn(self.value), 0)
+
+    def __add__(self, other) -> 'Dual':
+        if type(other) == Dual:
+            return Dual(self.value + other.value, self.first + other.first,
+                        self.second + other.second)
+        return Dual(self.value + other, self.first, self.second)
+
+    __radd__ = __add__
+
+    def __sub__(self, other) -> 'Dual':
+        return self + -other
+
+    def __rsub__(self, other) -> 'Dual':
+        return -self + other
+
+    def __mul__(self, other) -> 'Dual':
+        if type(other) == Dual:
+            return Dual(self.value * other.value,
+                        self.first * other.value + self.value * other.first,
+                        self.second * other.value
+                        + 2 * self.first * other.first
+                        + self.value * other.second)
+        return Dual(self.value * other, self.first * other,
+                    self.second * other)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other) -> 'Dual':
+        if type(other) == Dual:
+            return self * other._reciprocal()
+        return Dual(self.value / other, self.first / other,
+                    self.second / other)
+
+    def __rtruediv__(self, other) -> 'Dual':
+        return self._reciprocal() * other
+
+    def _reciprocal(self) -> 'Dual':
+        """Returns 1 / self."""
+        inverse = 1 / self.value
+        return self._chain(inverse, -inverse ** 2, 2 * inverse ** 3)
+
+    def __pow__(self, power) -> 'Dual':
+        if type(power) == Dual:
+            return e ** (power * ln(self))
+        elif power == 0:
+            return Dual(1)
+        elif power == 1:
+            return self
+        if self.value == 0 and self.first != 0 and type(power) != complex \
+                and 0 < power < 1:
+            # the first derivative of x^p with 0 < p < 1 is infinite at 0
+            first = float("inf")
+        else:
+            first = power * self.value ** (power - 1)
+        if self.value == 0 and type(power) != complex and power < 2:
+            # the second derivative of x^p with p < 2 is not defined at 0
+            second = float("nan")
+        else:
+            second = power * (power - 1) * self.value ** (power - 2)
+        return self._chain(self.value ** power, first, second)
+
+    def __rpow__(self, other) -> 'Dual':
+        value = other ** self.value
+        factor = ln(other)
+        return self._chain(value, value * factor, value * factor ** 2)
+
+
 def _check_types(arg: _Iterable, *types):
     """Checks if the elements of the argument belong to the given types."""
     for ele in arg:
@@ -365,7 +489,7 @@ def gcd(x: int, y: int) -> int:
 
 def lcm(x: int, y: int) -> int:
     """Least common multiply."""
-    return int(abs(x * y) / gcd(x, y)) if y != 0 else 0
+    return abs(x * y) // gcd(x, y) if y != 0 else 0
 
 
 def sgn(x: REAL) -> int:
@@ -404,6 +528,8 @@ def fac(x: REAL, opt: str = None):
 
 def ln(x: REAL) -> float:
     """Natural logarithm."""
+    if type(x) == Dual:
+        return x._chain(ln(x.value), 1 / x.value, -1 / x.value ** 2)
     if x <= 0:
         raise ArgumentError(x, "x >= 0")
     summand = 0
@@ -431,6 +557,9 @@ def log(x: REAL, base: REAL) -> float:
 
 def sin(x: REAL) -> float:
     """Sine."""
+    if type(x) == Dual:
+        value = sin(x.value)
+        return x._chain(value, cos(x.value), -value)
     x %= 2 * pi
     res = 0
     k = 0
@@ -444,6 +573,9 @@ def sin(x: REAL) -> float:
 
 def cos(x: REAL) -> float:
     """Cosine."""
+    if type(x) == Dual:
+        value = cos(x.value)
+        return x._chain(value, -sin(x.value), -value)
     x %= 2 * pi
     res = 0
     k = 0
@@ -462,10 +594,16 @@ def tan(x: REAL) -> float:
 
 def arcsin(x: REAL) -> float:
     """Arc sine."""
+    if type(x) == Dual:
+        first = (1 - x.value ** 2) ** -0.5
+        return x._chain(arcsin(x.value), first, x.value * first ** 3)
     if abs(x) > 1:
         raise ArgumentError("x > 1", "x <= 1")
     if abs(x) == 1:
         return sgn(x) * pi / 2
+    if abs(x) > 0.5:
+        # the series converges slowly close to 1
+        return sgn(x) * (pi / 2 - 2 * arcsin(((1 - abs(x)) / 2) ** 0.5))
     res = x
     k = 1
     start_time = time.time()
@@ -486,33 +624,31 @@ def arccos(x: REAL) -> float:
 
 def arctan(x: REAL) -> float:
     """Arc tangent."""
+    if type(x) == Dual:
+        first = 1 / (1 + x.value ** 2)
+        return x._chain(arctan(x.value), first, -2 * x.value * first ** 2)
+    if abs(x) > 1:
+        return sgn(x) * pi / 2 - arctan(1 / x)
+    if abs(x) > 0.5:
+        # the series converges slowly close to 1, the argument is halved
+        return 2 * arctan(x / (1 + (1 + x * x) ** 0.5))
     res = 0
     k = 0
-    if abs(x) <= 1:
-        start_time = time.time()
-        while (time.time() - start_time) < _MAX_CALCULATION_TIME:
-            mem_res = res
-            res += (-1)**k * x**(2*k + 1) / (2*k + 1)
-            if abs(mem_res - res) < _TAYLOR_DIFFERENCE:
-                break
-            k += 1
-    else:
-        if x >= 0:
-            res = pi / 2
-        else:
-            res = -pi / 2
-        start_time = time.time()
-        while (time.time() - start_time) < _MAX_CALCULATION_TIME:
-            mem_res = res
-            res += (-1)**(k + 1) / ((2*k + 1) * x**(2*k + 1))
-            if abs(mem_res - res) < _TAYLOR_DIFFERENCE:
-                break
-            k += 1
+    start_time = time.time()
+    while (time.time() - start_time) < _MAX_CALCULATION_TIME:
+        mem_res = res
+        res += (-1)**k * x**(2*k + 1) / (2*k + 1)
+        if abs(mem_res - res) < _TAYLOR_DIFFERENCE:
+            break
+        k += 1
     return res
 
 
 def sinh(x: REAL) -> float:
     """Hyperbolic sine."""
+    if type(x) == Dual:
+        value = sinh(x.value)
+        return x._chain(value, cosh(x.value), value)
     if abs(x) > 710:
         raise ArgumentError(x, "argument |x| < 710")
     res = 0
@@ -527,6 +663,9 @@ def sinh(x: REAL) -> float:
 
 def cosh(x: REAL) -> float:
     """Hyperbolic cosine."""
+    if type(x) == Dual:
+        value = cosh(x.value)
+        return x._chain(value, sinh(x.value), value)
     if abs(x) > 710:
         raise ArgumentError(x, "argument |x| < 710")
     res = 0
@@ -546,6 +685,9 @@ def tanh(x: REAL) -> float:
 
 def arsinh(x: REAL) -> float:
     """Inverse hyperbolic sine."""
+    if type(x) == Dual:
+        first = (x.value ** 2 + 1) ** -0.5
+        return x._chain(arsinh(x.value), first, -x.value * first ** 3)
     return sgn(x) * ln(abs(x) + (x**2 + 1)**0.5)
 
 
@@ -574,6 +716,7 @@ scope = {
     "ln": ln,
     "fac": fac,
     "sgn": sgn,
+    "abs": abs,
     "e": e,
     "pi": pi,
 }
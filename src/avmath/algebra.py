@@ -6,13 +6,16 @@ equations.
 
 import copy
 import logging
+import math
+import sys
+from array import array
 from typing import Union, Optional, List
 
 from . import ArgumentError, DimensionError, REAL, Fraction, sin, arccos,\
     _check_types
 from .analysis import Polynomial
 
-__all__ = ["Tuple", "Structure", "Matrix", "Vector", "SLE"]
+__all__ = ["Tuple", "Structure", "Matrix", "Vector", "VectorArray", "SLE"]
 
 
 class GeometricalError(Exception):
@@ -60,6 +63,8 @@ class Tuple:
     point in the coordinate system.
     """
 
+    __slots__ = ("_value",)
+
     def __init__(self, *args: REAL | list | tuple | 'Vector'):
         _check_types(args, int, float, list, tuple, Fraction, Vector, complex)
         if type(args[0]) in (list, tuple) and len(args) == 1:
@@ -67,10 +72,18 @@ class Tuple:
         else:
             self._value = list(args)
 
+    @classmethod
+    def _from_list(cls, value: list):
+        """Creates object from list without checking the element types.
+        Used for the results of internal arithmetic.
+        """
+        obj = object.__new__(cls)
+        obj._value = value
+        return obj
+
     def __iter__(self):
         """Returns iterator to convert tuple to iterable object."""
-        for ele in self._value:
-            yield ele
+        return iter(self._value)
 
     def __getitem__(self, item):
         """Returns value of 'item's dimension."""
@@ -100,25 +113,22 @@ class Tuple:
         """
         if not Tuple.dim_check(self, other):
             raise DimensionError(other.dim(), self.dim())
-        result = []
-        for i in range(self.dim()):
-            result.append(self[i] + other[i])
-        return Tuple(*tuple(result))
+        return Tuple._from_list([a + b for a, b in zip(self, other)])
 
     def __sub__(self, other: 'Tuple') -> 'Tuple':
         """Reversed addition:
         a - b = a + (-b)
         """
-        return self + -other
+        if not Tuple.dim_check(self, other):
+            raise DimensionError(other.dim(), self.dim())
+        return Tuple._from_list([a - b for a, b in zip(self, other)])
 
     def __mul__(self, other: REAL):
         """Scalar multiplication:
         r * a = (r*a_1, r*a_2, ... , r*a_n)    (a e R^n, r e R)
         """
-        result = []
-        for ele in self._value:
-            result.append(ele * other)
-        return Tuple(*tuple(result))
+        _check_types((other,), int, float, Fraction, complex)
+        return self._from_list([ele * other for ele in self._value])
 
     __rmul__ = __mul__
 
@@ -133,19 +143,17 @@ class Tuple:
                 ret_list.append(ele / other)
             else:
                 ret_list.append(Fraction(ele, other))
-        return Tuple(ret_list)
+        return Tuple._from_list(ret_list)
 
     def append(self, value: REAL):
         """Adds value to Tuple."""
-        ret_value = copy.deepcopy(self._value)
-        ret_value.append(value)
-        return Tuple(ret_value)
+        return Tuple._from_list(list(self) + [value])
 
     def no_fractions(self) -> 'Tuple':
         """Returns Tuple that does not contain Fractions.
         Converts Fractions to float.
         """
-        return Tuple([float(ele) for ele in self])
+        return Tuple._from_list([float(ele) for ele in self])
 
     @staticmethod
     def dim_check(*args) -> bool:
@@ -160,6 +168,8 @@ class Tuple:
 class Vector(Tuple):
     """Vector."""
 
+    __slots__ = ("_square", "_abs")
+
     def __init__(self, *args: REAL | 'Tuple',
                  begin: Optional['Tuple'] = None,
                  end: Optional['Tuple'] = None):
@@ -188,11 +198,12 @@ class Vector(Tuple):
         └ b_3 - a_3 ┘
         """
 
+        self._square = self._abs = None
         if not begin and type(args[0]) != Tuple:
             super().__init__(*args)
 
         elif not begin and type(args[0]) == Tuple:
-            super().__init__(*tuple(args[0]))
+            self._value = list(args[0])
 
         elif begin and end:
             _check_types((begin, end), Tuple)
@@ -210,11 +221,29 @@ class Vector(Tuple):
                ________________________________
             \\/ (a_1)^2 + (a_2)^2 + ... + (a_n)^2
             """
-        res = 0
-        for i in range(self.dim()):
-            res += self[i] ** 2
-        self.abs = res ** 0.5
-        return self.abs
+        if self._abs is None:
+            self._abs = self._abs_square() ** 0.5
+        return self._abs
+
+    @classmethod
+    def _from_list(cls, value: list) -> 'Vector':
+        """Creates vector from list without checking the element types.
+        Used for the results of internal arithmetic.
+        """
+        obj = super()._from_list(value)
+        obj._square = obj._abs = None
+        return obj
+
+    def _abs_square(self) -> REAL:
+        """Returns the squared absolute. Calculated once as vectors
+        are immutable.
+        """
+        if self._square is None:
+            res = 0
+            for ele in self:
+                res += ele * ele
+            self._square = res
+        return self._square
 
     def __add__(self, other: 'Vector') -> 'Vector':
         """Adds two tuples:
@@ -222,16 +251,15 @@ class Vector(Tuple):
         """
         if not Vector.dim_check(self, other):
             raise DimensionError(other.dim(), self.dim())
-        result = []
-        for i in range(self.dim()):
-            result.append(self[i] + other[i])
-        return Vector(*tuple(result))
+        return Vector._from_list([a + b for a, b in zip(self, other)])
 
     def __sub__(self, other: 'Vector') -> 'Vector':
         """Reversed addition:
         a - b = a + (-b)
         """
-        return self + -other
+        if not Vector.dim_check(self, other):
+            raise DimensionError(other.dim(), self.dim())
+        return Vector._from_list([a - b for a, b in zip(self, other)])
 
     def __mul__(self, other: REAL | 'Vector') -> REAL | 'Vector':
         """Either scalar product of two vectors or
@@ -242,13 +270,14 @@ class Vector(Tuple):
         (a_1, a_2, ..., a_n) * (b_1, b_2, ..., b_n)
         = a_1 b_1 + a_2 b_2 + ... + a_n b_n
         """
-        if type(other) != Vector:
-            return Vector(Tuple(*tuple(self)) * other)
+        if not isinstance(other, Vector):
+            _check_types((other,), int, float, Fraction, complex)
+            return Vector._from_list([ele * other for ele in self])
         if not Vector.dim_check(self, other):
             raise DimensionError(self.dim(), other.dim())
         res = 0
-        for i in range(self.dim()):
-            res += self[i] * other[i]
+        for a, b in zip(self, other):
+            res += a * b
         return res
 
     __rmul__ = __mul__
@@ -264,7 +293,7 @@ class Vector(Tuple):
                 ret_list.append(e / other)
             else:
                 ret_list.append(Fraction(e, other))
-        return Vector(Tuple(ret_list))
+        return Vector._from_list(ret_list)
 
     def __pow__(self, power: int) -> REAL | 'Vector':
         """Returns result of power times scalar multiplied vector.
@@ -279,6 +308,8 @@ class Vector(Tuple):
         _check_types((power,), int)
         if power == 0:
             return self.unit()
+        elif power == 2:
+            return self._abs_square()
         res = 1
         for i in range(power):
             res *= self
@@ -297,11 +328,11 @@ class Vector(Tuple):
             raise DimensionError(self.dim(), 3)
         elif other.dim() != 3:
             raise DimensionError(other.dim(), 3)
-        res = [0, 0, 0]
-        res[0] = (self[1] * other[2]) - (self[2] * other[1])
-        res[1] = (self[2] * other[0]) - (self[0] * other[2])
-        res[2] = (self[0] * other[1]) - (self[1] * other[0])
-        return Vector(*tuple(res))
+        a_1, a_2, a_3 = self
+        b_1, b_2, b_3 = other
+        return Vector._from_list([a_2 * b_3 - a_3 * b_2,
+                                  a_3 * b_1 - a_1 * b_3,
+                                  a_1 * b_2 - a_2 * b_1])
 
     def unit(self) -> 'Vector':
         """Returns vector with absolute 1 and same direction as self.
@@ -309,10 +340,11 @@ class Vector(Tuple):
         Vector(a_1, a_2, [...], a_n).unit()
         For
         a / |a|"""
-        if abs(self) == 0:
+        absolute = abs(self)
+        if absolute == 0:
             raise GeometricalError("Vector with absolute 0 has no unit vector")
         else:
-            res = self * (1 / abs(self))
+            res = self * (1 / absolute)
             return res
 
     def orthogonal(self, *args: 'Vector') -> list:
@@ -320,7 +352,7 @@ class Vector(Tuple):
         for i, e in enumerate(args):
             q.append(e)
             for e2 in q[:-1]:
-                q[i+1] -= Fraction(q[i+1]*e2, e2**2) * e2
+                q[i+1] -= Fraction(q[i+1]*e2, e2._abs_square()) * e2
         return q
 
     def leading_zeros(self) -> int:
@@ -328,7 +360,7 @@ class Vector(Tuple):
         matrix ref.
         """
         leading_0 = 0
-        for ele in self._value:
+        for ele in self:
             if ele == 0:
                 leading_0 += 1
             else:
@@ -339,7 +371,7 @@ class Vector(Tuple):
         """Returns Vector that does not contain Fractions.
         Converts Fractions to float.
         """
-        return Vector(*tuple([float(e) for e in self]))
+        return Vector._from_list([float(e) for e in self])
 
     @staticmethod
     def spat(u: 'Vector', v: 'Vector', w: 'Vector') -> float:
@@ -370,6 +402,211 @@ class Vector(Tuple):
         return angle
 
 
+class VectorArray:
+    """Array of vectors with the same dimension. The coordinates are
+    stored in one contiguous float buffer component by component
+    (first all x values, then all y values, ...).
+    """
+
+    __slots__ = ("_buffer", "_length", "_dim")
+
+    def __init__(self, *args: Union['Vector', 'Tuple', list, tuple]):
+        """Takes the vectors as Vector, Tuple or iterable.
+
+        Insert
+        VectorArray(Vector(a_1, a_2, a_3), Vector(b_1, b_2, b_3), ...)
+        for
+        ┌ a_1 ┐  ┌ b_1 ┐
+        | a_2 |, | b_2 |, ...
+        └ a_3 ┘  └ b_3 ┘
+        """
+        if not args:
+            raise ArgumentError("no vectors", "at least one vector")
+        dim = len(args[0])
+        for ele in args:
+            if len(ele) != dim:
+                raise DimensionError(len(ele), dim)
+        args = [list(ele) for ele in args]
+        self._buffer = array("d")
+        for k in range(dim):
+            self._buffer.extend([ele[k] for ele in args])
+        self._length = len(args)
+        self._dim = dim
+
+    @classmethod
+    def from_components(cls, *components) -> 'VectorArray':
+        """Creates array from one sequence per component.
+
+        Insert
+        VectorArray.from_components([a_1, b_1, ...], [a_2, b_2, ...])
+        for
+        ┌ a_1 ┐  ┌ b_1 ┐
+        └ a_2 ┘, └ b_2 ┘, ...
+        """
+        if not components:
+            raise ArgumentError("no components", "at least one component")
+        buffer = array("d")
+        for ele in components:
+            buffer.extend(ele)
+        length = len(buffer) // len(components)
+        if length * len(components) != len(buffer):
+            raise DimensionError(
+                other="Components have different amount of elements."
+            )
+        return cls._from_buffer(buffer, length, len(components))
+
+    @classmethod
+    def _from_buffer(cls, buffer: array, length: int, dim: int):
+        """Creates array from a buffer without checks."""
+        obj = object.__new__(cls)
+        obj._buffer = buffer
+        obj._length = length
+        obj._dim = dim
+        return obj
+
+    def __len__(self) -> int:
+        """Returns the amount of vectors."""
+        return self._length
+
+    def __getitem__(self, item: int) -> 'Vector':
+        """Returns vector of given index."""
+        i = range(self._length)[item]
+        return Vector._from_list(
+            [self._buffer[k * self._length + i] for k in range(self._dim)]
+        )
+
+    def __iter__(self):
+        """Yields the vectors."""
+        for ele in zip(*self.components()):
+            yield Vector._from_list(list(ele))
+
+    def __repr__(self) -> str:
+        """Returns string representation."""
+        return str(list(self))
+
+    def __abs__(self) -> array:
+        """Returns the absolutes of the vectors.
+        Insert
+        abs(VectorArray(a, b, ...))
+        For
+        [|a|, |b|, ...]
+        """
+        return array("d", [e ** 0.5 for e in self._dot(self.components())])
+
+    def dim(self) -> int:
+        """Returns the dimension of the vectors."""
+        return self._dim
+
+    def components(self) -> list:
+        """Returns a list with a memoryview on the buffer per
+        component. The views do not copy the buffer.
+        """
+        view = memoryview(self._buffer)
+        return [view[k * self._length:(k + 1) * self._length]
+                for k in range(self._dim)]
+
+    def dot(self, other: Union['VectorArray', 'Vector']) -> array:
+        """Returns the scalar products with the vectors of another array
+        or with a single vector.
+        Insert
+        VectorArray(a, b, ...).dot(VectorArray(u, v, ...))
+        For
+        [a * u, b * v, ...]
+        """
+        return array("d", self._dot(self._other_components(other)))
+
+    def cross(self, other: Union['VectorArray', 'Vector']) -> 'VectorArray':
+        """Returns the vector products with the vectors of another array
+        or with a single vector. Only 3 dimensions supported.
+        """
+        if self._dim != 3:
+            raise DimensionError(self._dim, 3)
+        x_1, y_1, z_1 = self.components()
+        x_2, y_2, z_2 = self._other_components(other)
+        buffer = array("d", [b_1 * c_2 - c_1 * b_2 for b_1, c_1, b_2, c_2
+                             in zip(y_1, z_1, y_2, z_2)])
+        buffer.extend([c_1 * a_2 - a_1 * c_2 for a_1, c_1, a_2, c_2
+                       in zip(x_1, z_1, x_2, z_2)])
+        buffer.extend([a_1 * b_2 - b_1 * a_2 for a_1, b_1, a_2, b_2
+                       in zip(x_1, y_1, x_2, y_2)])
+        return VectorArray._from_buffer(buffer, self._length, 3)
+
+    def unit(self) -> 'VectorArray':
+        """Returns the unit vectors of all vectors."""
+        absolutes = abs(self)
+        if 0 in absolutes:
+            raise GeometricalError("Vector with absolute 0 has no unit vector")
+        buffer = array("d")
+        for ele in self.components():
+            buffer.extend([e / a for e, a in zip(ele, absolutes)])
+        return VectorArray._from_buffer(buffer, self._length, self._dim)
+
+    def _dot(self, other_components: list) -> list:
+        """Returns list of the scalar products with given components."""
+        components = self.components()
+        res = [a * b for a, b in zip(components[0], other_components[0])]
+        for k in range(1, self._dim):
+            res = [r + a * b for r, a, b
+                   in zip(res, components[k], other_components[k])]
+        return res
+
+    def _other_components(self,
+                          other: Union['VectorArray', 'Vector']) -> list:
+        """Returns the components of another array or repeats the
+        coordinates of a single vector for every vector of self.
+        """
+        if isinstance(other, VectorArray):
+            if other.dim() != self._dim:
+                raise DimensionError(other.dim(), self._dim)
+            if len(other) != self._length:
+                raise DimensionError(
+                    other=f"Array with {len(other)} vectors cannot be "
+                          f"combined with array with {self._length} vectors."
+                )
+            return other.components()
+        if len(other) != self._dim:
+            raise DimensionError(len(other), self._dim)
+        return [array("d", [float(e)]) * self._length for e in other]
+
+    @staticmethod
+    def spat(u: Union['VectorArray', 'Vector'],
+             v: Union['VectorArray', 'Vector'],
+             w: Union['VectorArray', 'Vector']) -> array:
+        """Returns spat volumes. At least u must be an array.
+        Insert
+        VectorArray.spat(VectorArray(a, ...),
+                         VectorArray(b, ...),
+                         VectorArray(c, ...))
+        For
+        [(a x b) * c, ...]"""
+        return u.cross(v).dot(w)
+
+    @staticmethod
+    def angle(u: 'VectorArray', v: Union['VectorArray', 'Vector']) -> array:
+        """Returns angles between the vectors of an array and the vectors
+        of another array or a single vector.
+        Insert
+        VectorArray.angle(VectorArray(a, ...), VectorArray(b, ...))
+        For
+                 a * b
+        [arccos(-------), ...]    (1 < n < 4)
+                |a| |b|
+        """
+        if u.dim() not in (2, 3):
+            raise DimensionError(u.dim(), "2 or 3")
+        products = u.dot(v)
+        if isinstance(v, VectorArray):
+            v_absolutes = abs(v)
+        else:
+            v_absolutes = array("d", [abs(Vector._from_list(list(v)))]) \
+                * len(u)
+        norms = [a * b for a, b in zip(abs(u), v_absolutes)]
+        if 0 in norms:
+            raise GeometricalError("Vector with absolute 0 has no angle")
+        return array("d", [math.acos(max(-1., min(1., p / n)))
+                           for p, n in zip(products, norms)])
+
+
 class Structure:
     """Point structure"""
 
@@ -383,21 +620,43 @@ class Structure:
         if args[0].dim() > 3:
             raise DimensionError(other="Tuples must have 2 or 3 dimensions.")
         self.points = args
-        if self.points[0].dim() == 2:
-            self.points = [e.append(0) for e in self.points]
-        self.vectors = [Vector(begin=self.points[-1], end=self.points[0])]
-        for i in range(1, len(self.points)):
-            self.vectors.append(
-                Vector(begin=self.points[i - 1], end=self.points[i])
-            )
-
-    def flat(self) -> bool:
-        """Returns 'True' if the points are in a three-dimensional area."""
-        if Tuple.dim_check(*self.points) and self.points[1].dim() == 2:
+        self._vectors = None
+        self._normal = None
+
+    @property
+    def vectors(self) -> list:
+        """The links of the points. Calculated once."""
+        if self._vectors is None:
+            self._vectors = [
+                Vector._from_list([b - a for a, b in zip(begin, end)])
+                for begin, end in zip(self.points[-1:] + self.points[:-1],
+                                      self.points)
+            ]
+        return self._vectors
+
+    def flat(self, tolerance: float = 1e-9) -> bool:
+        """Returns 'True' if the points are in a three-dimensional area.
+        The points may have a distance of tolerance times the longest link
+        to the area.
+        """
+        if self.points[0].dim() == 2 or len(self.points) < 4:
             return True
-        unitvector = (self.vectors[0].cross(self.vectors[-1])).unit()
-        for i in range(len(self.vectors) - 1):
-            if (self.vectors[i].cross(self.vectors[i+1])).unit() != unitvector:
+        first = self.points[0]
+        distances = [Vector._from_list([a - b for a, b in zip(e, first)])
+                     for e in self.points[1:]]
+        longest = max([abs(e) for e in self.vectors])
+        normal = self._newell()
+        if abs(normal) == 0:
+            # the normal of Newell's method is also 0 for self-intersecting
+            # polygons, so the area is spanned by the longest distance and
+            # the distance that is least parallel to it
+            u = max(distances, key=abs)
+            normal = max([u.cross(e) for e in distances], key=abs)
+            if abs(normal) <= tolerance * abs(u) * longest:
+                return True
+        limit = tolerance * abs(normal) * longest
+        for e in distances:
+            if abs(normal * e) > limit:
                 return False
         return True
 
@@ -412,17 +671,32 @@ class Structure:
 
     def area(self, opt: str = None):
         """Returns area opened by any amount of vectors."""
-        area = Vector(0, 0, 0)
+        flat = self.flat()
         if opt == "flat":
-            if not self.flat():
+            if not flat:
                 raise GeometricalError("No flat area found.")
-        if not self.flat():
+        if not flat:
             GeometricalWarning("Area does not seem to be flat.")
-        for i in range(len(self.points) - 1):
-            abv = Vector(self.points[i] - self.points[0])
-            acv = Vector(self.points[i+1] - self.points[0])
-            area += abv.cross(acv) * 0.5
-        return abs(area)
+        return abs(self._newell()) / 2
+
+    def _newell(self) -> 'Vector':
+        """Returns the normal vector of the area by Newell's method
+        (shoelace formula for two dimensions). Its absolute is twice
+        the area. Calculated once.
+        """
+        if self._normal is None:
+            pairs = zip(self.points, self.points[1:] + self.points[:1])
+            x = y = z = 0
+            if self.points[0].dim() == 2:
+                for (x_1, y_1), (x_2, y_2) in pairs:
+                    z += x_1 * y_2 - x_2 * y_1
+            else:
+                for (x_1, y_1, z_1), (x_2, y_2, z_2) in pairs:
+                    x += (y_1 - y_2) * (z_1 + z_2)
+                    y += (z_1 - z_2) * (x_1 + x_2)
+                    z += (x_1 - x_2) * (y_1 + y_2)
+            self._normal = Vector._from_list([x, y, z])
+        return self._normal
 
     @staticmethod
     def triangulate(p: 'Tuple', q: 'Tuple', r: 'Tuple') -> float:
@@ -436,9 +710,132 @@ class Structure:
         return area
 
 
+def _balance(rows: list) -> list:
+    """Balances a square matrix in place by similarity transformations
+    with powers of 2 (Parlett-Reinsch). Row and column norms get the
+    same magnitude, which reduces the rounding errors of eigenvalue
+    methods. The eigenvalues do not change.
+    """
+    n = len(rows)
+    balanced = False
+    while not balanced:
+        balanced = True
+        for i in range(n):
+            c = sum([abs(rows[j][i]) for j in range(n) if j != i])
+            r = sum([abs(rows[i][j]) for j in range(n) if j != i])
+            if c == 0 or r == 0:
+                continue
+            total, f = c + r, 1
+            while c < r / 2:
+                f, c = f * 2, c * 4
+            while c > r * 2:
+                f, c = f / 2, c / 4
+            if (c + r) / f < 0.95 * total:
+                balanced = False
+                for j in range(n):
+                    rows[i][j] /= f
+                    rows[j][i] *= f
+    return rows
+
+
+def _hessenberg(rows: list) -> list:
+    """Reduces a square matrix in place to upper Hessenberg form by
+    Gaussian elimination with pivoting. The eigenvalues do not change.
+    """
+    n = len(rows)
+    for m in range(1, n - 1):
+        pivot = max(range(m, n), key=lambda i: abs(rows[i][m - 1]))
+        if pivot != m:
+            rows[m], rows[pivot] = rows[pivot], rows[m]
+            for row in rows:
+                row[m], row[pivot] = row[pivot], row[m]
+        x = rows[m][m - 1]
+        if x == 0:
+            continue
+        for i in range(m + 1, n):
+            y = rows[i][m - 1] / x
+            if y == 0:
+                continue
+            rows[i][m - 1] = 0
+            for j in range(m, n):
+                rows[i][j] -= y * rows[m][j]
+            for row in rows:
+                row[m] += y * row[i]
+    return rows
+
+
+def _hessenberg_qr(rows: list, tolerance: float,
+                   max_iterations: int) -> tuple:
+    """Calculates the eigenvalues of an upper Hessenberg matrix with the
+    shifted QR algorithm. Works in place with complex arithmetic and
+    Wilkinson shifts. Eigenvalues are split off as soon as a subdiagonal
+    element is smaller than tolerance times its diagonal neighbours.
+    Returns the eigenvalues, the largest neglected subdiagonal element,
+    the number of iterations and whether all eigenvalues converged.
+    """
+    h = [[complex(e) for e in row] for row in rows]
+    norm = max([sum([abs(e) for e in row]) for row in h] + [0])
+    values, error, iterations, converged = [], 0, 0, True
+    high = len(h) - 1
+    while high >= 0:
+        for iteration in range(max_iterations + 1):
+            low = high
+            while low > 0:
+                scale = abs(h[low - 1][low - 1]) + abs(h[low][low]) or norm
+                if abs(h[low][low - 1]) <= tolerance * scale:
+                    error = max(error, abs(h[low][low - 1]))
+                    h[low][low - 1] = 0
+                    break
+                low -= 1
+            if low == high or iteration == max_iterations:
+                break
+            iterations += 1
+            a, b = h[high - 1][high - 1], h[high - 1][high]
+            c, d = h[high][high - 1], h[high][high]
+            root = (((a - d) / 2) ** 2 + b * c) ** 0.5
+            shift = min(((a + d) / 2 + root, (a + d) / 2 - root),
+                        key=lambda mu: abs(mu - d))
+            if iteration % 10 == 9:
+                shift = d + abs(c)
+            for k in range(low, high + 1):
+                h[k][k] -= shift
+            rotations = []
+            for k in range(low, high):
+                x, y = h[k][k], h[k + 1][k]
+                r = (abs(x) ** 2 + abs(y) ** 2) ** 0.5
+                cosine, sine = (1, 0) if r == 0 else (x / r, y / r)
+                rotations.append((cosine, sine))
+                for j in range(k, high + 1):
+                    u, v = h[k][j], h[k + 1][j]
+                    h[k][j] = cosine.conjugate() * u + sine.conjugate() * v
+                    h[k + 1][j] = cosine * v - sine * u
+            for k, (cosine, sine) in enumerate(rotations, low):
+                for i in range(low, k + 2):
+                    u, v = h[i][k], h[i][k + 1]
+                    h[i][k] = cosine * u + sine * v
+                    h[i][k + 1] = cosine.conjugate() * v - sine.conjugate() * u
+            for k in range(low, high + 1):
+                h[k][k] += shift
+        if low != high:
+            converged = False
+        values.append(h[high][high])
+        high -= 1
+    return values, error, iterations, converged
+
+
+_EIGENVALUE_METHODS = ("characteristic", "qr")
+
+
 class Matrix(Tuple):
     """Mathematical matrix"""
 
+    # _shared is True while views map onto the list of rows. _private
+    # holds the indices of the rows copied since, None if no row is shared.
+    # Rows are copied before the next possible write, so views keep the
+    # values of their creation.
+    _shared = False
+    _private = None
+
     def __init__(self, *args: tuple | list | Vector):
         """Initializes the matrix. Enter a list for each row.
 
@@ -451,13 +848,13 @@ class Matrix(Tuple):
         | a_21  a_22  a_23 |
         └ a_31  a_32  a_33 ┘
         """
-        if type(args[0]) == Vector and len(args) == 1:
+        if isinstance(args[0], Vector) and len(args) == 1:
             value = []
-            for e in args[0]._value:
+            for e in args[0]:
                 value.append([e])
             super().__init__(*value)
         else:
-            value = list(args)
+            value = [list(e) for e in args]
             for e in value:
                 if not len(value[0]) == len(e):
                     raise ArgumentError(e, f"row with {len(args[0])} members")
@@ -505,6 +902,62 @@ class Matrix(Tuple):
             ret_str += "\n"
         return ret_str
 
+    def __getitem__(self, item):
+        """Returns row of given index. The row may be written, so a
+        row shared with views is copied first.
+        """
+        if self._private is not None:
+            if type(item) == slice:
+                for i in range(len(self._value))[item]:
+                    self._own(i)
+            else:
+                self._own(item)
+        return self._value[item]
+
+    def __iter__(self):
+        """Yields the rows. Rows shared with views are copied first."""
+        if self._private is not None:
+            self._detach()
+        return iter(self._value)
+
+    def _element(self, i: int, j: int) -> REAL:
+        """Returns element in row i and column j without copying."""
+        return self._value[i][j]
+
+    def _share(self) -> list:
+        """Returns the storage for a view. The matrix copies the rows
+        before the next possible write.
+        """
+        self._shared = True
+        self._private = set()
+        return self._value
+
+    def _own(self, i: int):
+        """Copies row i if it is shared with views."""
+        value = self._value
+        i = range(len(value))[i]
+        if i in self._private:
+            return
+        if self._shared:
+            value = self._value = list(value)
+            self._shared = False
+        value[i] = list(value[i])
+        self._private.add(i)
+        if len(self._private) == len(value):
+            self._private = None
+
+    def _detach(self):
+        """Copies all rows shared with views."""
+        if self._shared:
+            self._value = [list(e) for e in self._value]
+        else:
+            value = self._value
+            for i in range(len(value)):
+                if i not in self._private:
+                    value[i] = list(value[i])
+        self._shared = False
+        self._private = None
+
     def __round__(self, n: int = None) -> 'Matrix':
         """Returns matrix with rounded values."""
         ret_mat = copy.deepcopy(self)
@@ -524,7 +977,7 @@ class Matrix(Tuple):
 
     def __add__(self, other: 'Matrix') -> 'Matrix':
         """Adds two matrices."""
-        if type(other) != Matrix:
+        if not isinstance(other, Matrix):
             raise ArgumentError(type(other), Matrix)
         elif self.size() != other.size():
             raise ArgumentError("matrix with size " + str(other.size()),
@@ -552,27 +1005,26 @@ class Matrix(Tuple):
                     args[i].append(e * other)
             return Matrix(*tuple(args))
 
-        elif type(other) == Vector:
+        elif isinstance(other, Vector):
             if self.size()[1] != other.dim():
                 raise MatrixError(f"Vector with size {other.dim()} cannot "
                                   f"be multiplied by matrix with "
                                   f"size {self.size()}")
             v_matrix = Matrix(other)
             ret_mat = self * v_matrix
-            args = ()
-            for e in ret_mat._value:
-                args += (e[0],)
-            return Vector(*args)
+            return Vector._from_list([e[0] for e in ret_mat._value])
 
-        elif type(other) == Matrix:
+        elif isinstance(other, Matrix):
             if self.size()[1] != other.size()[0]:
                 raise MatrixError(f"Matrix with {other.size()[0]} "
                                   f"rows cannot be multiplied"
                                   f" by {self.size()[1]} column matrix.")
             ret_mat = Matrix.create(self.size()[0], other.size()[1])
+            columns = [other.column(j) for j in range(other.size()[1])]
             for i in range(self.size()[0]):
+                row = self.row(i)
                 for j in range(other.size()[1]):
-                    ret_mat[i][j] = self.row(i) * other.column(j)
+                    ret_mat[i][j] = row * columns[j]
             return ret_mat
 
     __rmul__ = __mul__
@@ -622,9 +1074,9 @@ class Matrix(Tuple):
         """
         position = []
         for i in range(self.size()[0]):
-            for e in self[i]:
+            for j, e in enumerate(self[i]):
                 if element == e:
-                    position.append([self[i].index(e), i])
+                    position.append([j, i])
         return position
 
     def no_fractions(self) -> 'Matrix':
@@ -638,17 +1090,16 @@ class Matrix(Tuple):
 
     def column(self, column_index: int) -> 'Vector':
         """Returns column with specific index."""
-        ret_list = []
-        for e in self._value:
-            ret_list.append(e[column_index])
-        return Vector(*tuple(ret_list))
+        return Vector._from_list([e[column_index] for e in self._value])
 
     def row(self, row_index: int) -> 'Vector':
         """Returns row with specific index."""
-        return Vector(*tuple(self[row_index]))
+        return Vector._from_list(list(self._value[row_index]))
 
     def append(self, row=None, column=None) -> 'Matrix':
         """Method to append rows or columns to matrix."""
+        if self._private is not None:
+            self._detach()
         ret_mat = self
         if row:
             if len(row) != self.size()[1]:
@@ -666,41 +1117,44 @@ class Matrix(Tuple):
     def remove(self,
                row_index: int = None,
                column_index: int = None) -> 'Matrix':
-        """Returns a matrix with given row or column removed."""
-        ret_mat = copy.deepcopy(self)
+        """Returns a matrix with given row or column removed.
+        The returned matrix is a view on self.
+        """
+        rows = list(range(self.size()[0]))
+        columns = list(range(self.size()[1]))
         if row_index is not None:
-            del ret_mat._value[row_index]
+            del rows[row_index]
         if column_index is not None:
-            for i in range(len(ret_mat._value)):
-                del ret_mat._value[i][column_index]
-        return ret_mat
+            del columns[column_index]
+        return _MatrixView(self._share(), rows, columns)
 
     def transpose(self) -> 'Matrix':
-        """Returns transposed matrix."""
-        args = []
-        for i in range(self.size()[1]):
-            args.append(list(self.column(i)))
-        return Matrix(*tuple(args))
+        """Returns transposed matrix. The returned matrix is a view
+        on self.
+        """
+        return _MatrixView(self._share(), range(self.size()[0]),
+                           range(self.size()[1]), transposed=True)
 
     def det(self, mode: str = "gauss") -> Union[REAL, 'Polynomial']:
         """Returns determinant of a matrix."""
         if self.size()[0] != self.size()[1]:
             raise MatrixError("Matrix must be quadratic.")
+        a = self._element
         if self.size() == [1, 1]:
-            return self[0][0]
+            return a(0, 0)
         elif self.size() == [3, 3]:
-            det = self[0][0] * self[1][1] * self[2][2] \
-                  + self[0][1] * self[1][2] * self[2][0] \
-                  + self[0][2] * self[1][0] * self[2][1] \
-                  - self[0][0] * self[1][2] * self[2][1] \
-                  - self[0][1] * self[1][0] * self[2][2] \
-                  - self[0][2] * self[1][1] * self[2][0]
+            det = a(0, 0) * a(1, 1) * a(2, 2) \
+                  + a(0, 1) * a(1, 2) * a(2, 0) \
+                  + a(0, 2) * a(1, 0) * a(2, 1) \
+                  - a(0, 0) * a(1, 2) * a(2, 1) \
+                  - a(0, 1) * a(1, 0) * a(2, 2) \
+                  - a(0, 2) * a(1, 1) * a(2, 0)
             return det
         elif (3 < self.size()[0] < 6) or mode == "laplace":
             answer = 0
             for i in range(self.size()[1]):
                 smaller_matrix = self.remove(0, i)
-                k = (-1) ** i * self[0][i] * smaller_matrix.det()
+                k = (-1) ** i * a(0, i) * smaller_matrix.det()
                 answer += k
         else:
             det = 1
@@ -736,10 +1190,7 @@ class Matrix(Tuple):
         for i in range(self.size()[1]):
             for j in range(self.size()[0]):
                 smaller_matrix = self.remove(i, j)
-                if smaller_matrix.size() == [1, 1]:
-                    ret_mat[i][j] = (-1) ** (i + j) * smaller_matrix[0][0]
-                else:
-                    ret_mat[i][j] = (-1) ** (i + j) * self.remove(i, j).det()
+                ret_mat[i][j] = (-1) ** (i + j) * smaller_matrix.det()
         return ret_mat
 
     def adj(self) -> 'Matrix':
@@ -818,12 +1269,27 @@ class Matrix(Tuple):
                               / abs(orthogonal_vectors[i])
         return Q.no_fractions(), R.no_fractions()
 
-    def eigenvalues(self, mode=complex):
-        """Calculates the real eigenvalues of a matrix.
+    def eigenvalues(self, mode=complex, method: str = "characteristic"):
+        """Calculates the eigenvalues of a matrix.
         `mode=float` or `mode="real"` returns real eigenvalues
-        only.
+        only. `method="characteristic"` finds the roots of the
+        characteristic polynomial, `method="qr"` balances the matrix
+        and runs the shifted QR algorithm on its Hessenberg form.
         """
-        values = copy.deepcopy(list(self))
+        if method not in _EIGENVALUE_METHODS:
+            raise ArgumentError(method, _EIGENVALUE_METHODS)
+        if self.size()[0] != self.size()[1]:
+            raise MatrixError("Matrix must be quadratic.")
+        if method == "qr":
+            rows = _hessenberg(_balance([[float(e) for e in row]
+                                         for row in self]))
+            values = _hessenberg_qr(rows, sys.float_info.epsilon, 100)[0]
+            values = sorted(values, key=lambda z: (z.real, z.imag))
+            if mode == float or mode == "real":
+                return [z.real for z in values
+                        if abs(z.imag) <= 1e-9 * max(1, abs(z))]
+            return values
+        values = [list(e) for e in self]
         for i in range(self.size()[0]):
             function = Polynomial(-1, values[i][i])
             values[i][i] = function
@@ -831,7 +1297,7 @@ class Matrix(Tuple):
 
     def eigenvector(self, eigenvalue):
         """Calculates the eigenvector to a given eigenvalue."""
-        A = list(copy.deepcopy(self))
+        A = [list(e) for e in self]
         for i in range(len(A)):
             A[i][i] = A[i][i] - eigenvalue
         A = Matrix(*tuple(A))
@@ -851,6 +1317,21 @@ class Matrix(Tuple):
                 args[i].append(0)
         return Matrix(*tuple(args))
 
+    @staticmethod
+    def create_companion(polynomial: 'Polynomial') -> 'Matrix':
+        """Staticmethod to create the companion matrix of a polynomial.
+        Its eigenvalues are the roots of the polynomial.
+        """
+        if polynomial.degree() < 1:
+            raise ArgumentError(polynomial, "polynomial of degree 1 or higher")
+        lead = polynomial[0]
+        ret_mat = Matrix.create(polynomial.degree(), polynomial.degree())
+        for j in range(polynomial.degree()):
+            ret_mat[0][j] = Fraction(-polynomial[j + 1], lead)
+        for i in range(1, polynomial.degree()):
+            ret_mat[i][i - 1] = 1
+        return ret_mat
+
     @staticmethod
     def create_identity(n: int) -> 'Matrix':
         """Staticmethod to create an identity matrix with any
@@ -879,6 +1360,107 @@ class Matrix(Tuple):
         return sorted_arg_list
 
 
+class _MatrixView(Matrix):
+    """Matrix that maps onto the storage of another matrix through
+    row and column indices. Used for minors and transposed matrices.
+    The view is materialized to an own storage on the first row access,
+    as the row may be written.
+    """
+
+    def __init__(self,
+                 storage: list,
+                 rows: range | list,
+                 columns: range | list,
+                 transposed: bool = False):
+        """Takes the nested list of the matrix, the indices of the rows
+        and columns that are kept and whether the view is transposed.
+        """
+        self._storage = storage
+        self._rows = rows
+        self._columns = columns
+        self._transposed = transposed
+        self._materialized = False
+
+    @property
+    def _value(self) -> list:
+        """Returns the storage of the view. Materializes the view as
+        the storage may be written afterwards.
+        """
+        if not self._materialized:
+            self._storage = self._copy()
+            self._materialized = True
+        return self._storage
+
+    @_value.setter
+    def _value(self, value: list):
+        self._storage = value
+
+    def _copy(self) -> list:
+        """Returns a nested list with the elements of the view."""
+        m, n = self.size()
+        return [[self._element(i, j) for j in range(n)] for i in range(m)]
+
+    def __len__(self) -> int:
+        """Returns the amount of rows."""
+        return self.size()[0]
+
+    def __deepcopy__(self, memo) -> 'Matrix':
+        """Returns a matrix that owns copies of the elements."""
+        return Matrix(*copy.deepcopy(self._copy(), memo))
+
+    def _element(self, i: int, j: int) -> REAL:
+        """Returns element in row i and column j without copying."""
+        if self._materialized:
+            return self._storage[i][j]
+        if self._transposed:
+            return self._storage[self._rows[j]][self._columns[i]]
+        return self._storage[self._rows[i]][self._columns[j]]
+
+    def size(self, option: str = None) -> list:
+        """Returns list of matrix size. [m, n]"""
+        if self._materialized:
+            size = [len(self._storage), len(self._storage[0])]
+        elif self._transposed:
+            size = [len(self._columns), len(self._rows)]
+        else:
+            size = [len(self._rows), len(self._columns)]
+        if option == "xy":
+            size.reverse()
+        return size
+
+    def column(self, column_index: int) -> 'Vector':
+        """Returns column with specific index."""
+        return Vector._from_list([self._element(i, column_index)
+                                  for i in range(self.size()[0])])
+
+    def row(self, row_index: int) -> 'Vector':
+        """Returns row with specific index."""
+        return Vector._from_list([self._element(row_index, j)
+                                  for j in range(self.size()[1])])
+
+    def remove(self,
+               row_index: int = None,
+               column_index: int = None) -> 'Matrix':
+        """Returns a view with given row or column removed."""
+        if self._materialized:
+            return super().remove(row_index, column_index)
+        rows, columns = list(self._rows), list(self._columns)
+        if self._transposed:
+            row_index, column_index = column_index, row_index
+        if row_index is not None:
+            del rows[row_index]
+        if column_index is not None:
+            del columns[column_index]
+        return _MatrixView(self._storage, rows, columns, self._transposed)
+
+    def transpose(self) -> 'Matrix':
+        """Returns transposed view."""
+        if self._materialized:
+            return super().transpose()
+        return _MatrixView(self._storage, self._rows, self._columns,
+                           not self._transposed)
+
+
 class SLE(Matrix):
     """System of linear equations"""
     def __init__(self, *args: List[REAL]):
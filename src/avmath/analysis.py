@@ -2,13 +2,20 @@
 AdVanced math  analysis submodule
 implementing function features."""
 
-__all__ = ["Point", "Function", "Polynomial"]
+__all__ = ["Point", "PointArray", "NumericalResult", "Function", "Polynomial",
+           "Chebyshev", "Legendre", "PiecewisePolynomial", "Spline"]
 
-import copy
+import ast
+import heapq
 import sys
+from abc import ABC, abstractmethod
+from array import array
+from bisect import bisect_right
+from operator import truediv
 from typing import Union
 
-from . import scope as _scope, REAL, sgn,is_even, Fraction, ArgumentError
+from . import scope as _scope, REAL, sgn, is_even, gcd, lcm, Fraction, \
+    Dual, ArgumentError, e as _e, pi, sin, cos, fac
 
 eps = sys.float_info.epsilon
 
@@ -16,23 +23,1039 @@ eps = sys.float_info.epsilon
 class Point:
     """Point in coordinate system. (Two dimensions)"""
 
+    __slots__ = ("x", "y")
+
     def __init__(self, x: REAL, y: REAL):
         """Initialises the point. Give x and y value."""
-        self._value = [x, y]
+        self.x = x
+        self.y = y
 
     def __iter__(self):
-        for e in self._value:
-            yield e
+        yield self.x
+        yield self.y
 
     def __repr__(self):
         return str(tuple(self))
 
     def __getitem__(self, item):
-        return self._value[item]
+        return (self.x, self.y)[item]
+
+    def __eq__(self, other) -> bool:
+        if type(other) != Point:
+            return NotImplemented
+        return self.x == other.x and self.y == other.y
 
     def negative_y(self) -> 'Point':
         """Returns a point with negative y coordinate."""
-        return Point(self[0], -self[1])
+        return Point(self.x, -self.y)
+
+
+class PointArray:
+    """Array of points. The x and y coordinates are stored in two
+    columns, float buffers if all coordinates are real numbers.
+    """
+
+    __slots__ = ("_x", "_y")
+
+    def __init__(self, *args: Union[Point, list, tuple]):
+        """Takes the points as Point or iterable of x and y.
+
+        Insert
+        PointArray(Point(x_1, y_1), Point(x_2, y_2), ...)
+        """
+        args = [tuple(ele) for ele in args]
+        for ele in args:
+            if len(ele) != 2:
+                raise ArgumentError(ele, "point with x and y")
+        self._x = _column([ele[0] for ele in args])
+        self._y = _column([ele[1] for ele in args])
+
+    @classmethod
+    def from_coordinates(cls, x, y) -> 'PointArray':
+        """Creates array from the sequence of x and the sequence of
+        y coordinates.
+        """
+        if len(x) != len(y):
+            raise ArgumentError((len(x), len(y)), "same amount of x and y")
+        return cls._from_columns(_column(list(x)), _column(list(y)))
+
+    @classmethod
+    def _from_columns(cls, x: array | list, y: array | list):
+        """Creates array from columns without checks."""
+        obj = object.__new__(cls)
+        obj._x = x
+        obj._y = y
+        return obj
+
+    def __len__(self) -> int:
+        """Returns the amount of points."""
+        return len(self._x)
+
+    def __getitem__(self, item: int | slice) -> 'Point | PointArray':
+        """Returns point of given index or array of given slice."""
+        if type(item) == slice:
+            return PointArray._from_columns(self._x[item], self._y[item])
+        return Point(self._x[item], self._y[item])
+
+    def __iter__(self):
+        """Yields the points."""
+        for x, y in zip(self._x, self._y):
+            yield Point(x, y)
+
+    def __eq__(self, other) -> bool:
+        if type(other) != PointArray:
+            return NotImplemented
+        return list(self._x) == list(other._x) \
+            and list(self._y) == list(other._y)
+
+    def __repr__(self) -> str:
+        """Returns string representation."""
+        return str(list(self))
+
+    def coordinates(self) -> tuple:
+        """Returns the x and the y column. Float buffers are returned
+        as memoryviews that do not copy the buffer.
+        """
+        return tuple(memoryview(e) if type(e) == array else e
+                     for e in (self._x, self._y))
+
+    def append(self, point: Point | list | tuple):
+        """Appends a point to the array."""
+        x, y = point
+        if type(self._x) == array and type(x) in (int, float) \
+                and type(y) in (int, float):
+            self._x.append(x)
+            self._y.append(y)
+            return
+        self._x = list(self._x) + [x]
+        self._y = list(self._y) + [y]
+
+    def unique(self, tolerance: float = 1e-9) -> 'PointArray':
+        """Returns the array without points lying within tolerance of
+        an earlier point in both coordinates. The points are hashed into
+        a grid with cells of width tolerance, so only the neighbouring
+        cells need to be compared. Points with infinite or nan
+        coordinates are only removed if they are equal.
+        """
+        if tolerance <= 0:
+            raise ArgumentError(tolerance, "positive tolerance")
+        grid, not_finite = {}, set()
+        x_column, y_column = [], []
+        for x, y in zip(self._x, self._y):
+            if not (_is_finite(x) and _is_finite(y)):
+                if (repr(x), repr(y)) not in not_finite:
+                    not_finite.add((repr(x), repr(y)))
+                    x_column.append(x)
+                    y_column.append(y)
+                continue
+            i = int(complex(x).real // tolerance)
+            j = int(complex(y).real // tolerance)
+            if any(abs(x - u) <= tolerance and abs(y - v) <= tolerance
+                   for a in (i - 1, i, i + 1) for b in (j - 1, j, j + 1)
+                   for u, v in grid.get((a, b), ())):
+                continue
+            grid.setdefault((i, j), []).append((x, y))
+            x_column.append(x)
+            y_column.append(y)
+        return PointArray._from_columns(_column(x_column), _column(y_column))
+
+
+def _column(values: list) -> array | list:
+    """Returns a float buffer for real numbers, otherwise the list
+    itself (complex numbers and exact fractions).
+    """
+    if all(type(e) in (int, float) for e in values):
+        return array("d", values)
+    return values
+
+
+class NumericalResult:
+    """Result of a numerical method. Contains the value, the estimated
+    error, the amount of function evaluations and iterations and whether
+    the method reached the demanded tolerance.
+    """
+
+    __slots__ = ("value", "error", "evaluations", "iterations", "converged")
+
+    def __init__(self,
+                 value,
+                 error: float = None,
+                 evaluations: int = 0,
+                 iterations: int = 0,
+                 converged: bool = True):
+        self.value = value
+        self.error = error
+        self.evaluations = evaluations
+        self.iterations = iterations
+        self.converged = converged
+
+    def __repr__(self):
+        return f"NumericalResult(value={self.value}, error={self.error}, " \
+               f"evaluations={self.evaluations}, " \
+               f"iterations={self.iterations}, converged={self.converged})"
+
+
+class _Expression(ABC):
+    """Node of the expression tree of a function term. Equal nodes may be
+    shared, so the tree is a directed acyclic graph.
+    """
+
+    __slots__ = ()
+    precedence = 5
+    operands = ()
+
+    def __str__(self):
+        strings = {}
+        for node in _postorder(self):
+            strings[id(node)] = node._format(
+                [strings[id(e)] for e in node.operands]
+            )
+        return strings[id(self)]
+
+    @abstractmethod
+    def _format(self, operands: list) -> str:
+        """Returns the term of the node with given operand terms."""
+
+    def _code(self, operands: list) -> str:
+        """Returns the Python code of the node with given operand code."""
+        return self._format(operands)
+
+    def _key(self) -> tuple:
+        """Returns the key of the node without its operands."""
+        return type(self),
+
+    def derivative(self) -> '_Expression':
+        """Returns the derivative of the expression for x."""
+        derivatives = {}
+        for node in _postorder(self):
+            derivatives[id(node)] = node._derivative(
+                [derivatives[id(e)] for e in node.operands]
+            )
+        return derivatives[id(self)]
+
+    def _derivative(self, derivatives: list) -> '_Expression':
+        """Returns the derivative of the node with given derivatives of
+        the operands. An operand with derivative 0 is constant.
+        """
+        return _Number(0)
+
+
+class _Number(_Expression):
+    """Number in a term."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: int | float | complex):
+        self.value = value
+
+    def _format(self, operands: list) -> str:
+        return repr(self.value)
+
+    def _code(self, operands: list) -> str:
+        if self.precedence == 3:
+            return f"({self.value!r})"
+        return repr(self.value)
+
+    def _key(self) -> tuple:
+        return type(self), repr(self.value)
+
+    @property
+    def precedence(self) -> int:
+        """Negative numbers are treated like negations."""
+        return 3 if repr(self.value)[0] == "-" else 5
+
+
+class _Variable(_Expression):
+    """The variable x."""
+
+    __slots__ = ()
+
+    def _format(self, operands: list) -> str:
+        return "x"
+
+    def _derivative(self, derivatives: list) -> '_Expression':
+        return _Number(1)
+
+
+class _Name(_Expression):
+    """Constant of the scope like pi or e."""
+
+    __slots__ = ("name",)
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def _format(self, operands: list) -> str:
+        return self.name
+
+    def _key(self) -> tuple:
+        return type(self), self.name
+
+
+class _Negation(_Expression):
+    """Negative expression."""
+
+    __slots__ = ("operand",)
+    precedence = 3
+
+    def __init__(self, operand: _Expression):
+        self.operand = operand
+
+    @property
+    def operands(self) -> tuple:
+        return self.operand,
+
+    def _format(self, operands: list) -> str:
+        if self.operand.precedence <= self.precedence:
+            return f"-({operands[0]})"
+        return f"-{operands[0]}"
+
+    def _code(self, operands: list) -> str:
+        return f"(-{operands[0]})"
+
+    def _derivative(self, derivatives: list) -> '_Expression':
+        return _negative(derivatives[0])
+
+
+class _Operation(_Expression):
+    """Arithmetic operation +, -, *, / or ^ of two expressions."""
+
+    __slots__ = ("operator", "left", "right")
+
+    def __init__(self, operator: str, left: _Expression, right: _Expression):
+        self.operator = operator
+        self.left = left
+        self.right = right
+
+    @property
+    def precedence(self) -> int:
+        return _PRECEDENCE[self.operator]
+
+    @property
+    def operands(self) -> tuple:
+        return self.left, self.right
+
+    def _format(self, operands: list) -> str:
+        left, right = operands
+        if self.left.precedence < self.precedence \
+                or self.operator == "^" and self.left.precedence == 4:
+            left = f"({left})"
+        if self.right.precedence < self.precedence \
+                or self.operator in "-/" \
+                and self.right.precedence == self.precedence:
+            right = f"({right})"
+        if self.operator == "^":
+            return f"{left}^{right}"
+        return f"{left} {self.operator} {right}"
+
+    def _code(self, operands: list) -> str:
+        if self.operator != "^":
+            return f"({operands[0]} {self.operator} {operands[1]})"
+        # only powers with a float or complex number cannot create huge
+        # integers, all other powers are bounded at evaluation time
+        if any([_is_number(e) and type(e.value) != int
+                for e in self.operands]):
+            return f"({operands[0]} ** {operands[1]})"
+        return f"_power({operands[0]}, {operands[1]})"
+
+    def _key(self) -> tuple:
+        return type(self), self.operator
+
+    def _derivative(self, derivatives: list) -> '_Expression':
+        u, v = self.left, self.right
+        du, dv = derivatives
+        if self.operator == "+":
+            return _sum(du, dv)
+        elif self.operator == "-":
+            return _difference(du, dv)
+        elif self.operator == "*":
+            return _sum(_product(du, v), _product(u, dv))
+        elif self.operator == "/" and _is_number(dv, 0):
+            return _quotient(du, v)
+        elif self.operator == "/":
+            return _quotient(
+                _difference(_product(du, v), _product(u, dv)),
+                _power(v, _Number(2))
+            )
+        elif _is_number(dv, 0):
+            return _product(
+                _product(v, _power(u, _difference(v, _Number(1)))), du
+            )
+        elif _is_number(du, 0):
+            return _product(_product(self, _Call("ln", (u,))), dv)
+        return _product(self, _sum(
+            _product(dv, _Call("ln", (u,))),
+            _quotient(_product(v, du), u)
+        ))
+
+
+class _Call(_Expression):
+    """Call of a function of the scope."""
+
+    __slots__ = ("name", "arguments")
+
+    def __init__(self, name: str, arguments: tuple):
+        self.name = name
+        self.arguments = arguments
+
+    @property
+    def operands(self) -> tuple:
+        return self.arguments
+
+    def _format(self, operands: list) -> str:
+        return f"{self.name}({', '.join(operands)})"
+
+    def _key(self) -> tuple:
+        return type(self), self.name
+
+    def _derivative(self, derivatives: list) -> '_Expression':
+        if all([_is_number(e, 0) for e in derivatives]):
+            return _Number(0)
+        if self.name == "log" and len(self.arguments) == 2:
+            return _quotient(_Call("ln", self.arguments[:1]),
+                             _Call("ln", self.arguments[1:])).derivative()
+        if self.name not in _DERIVATIVES or len(self.arguments) != 1:
+            raise ArgumentError(f"{self.name}()",
+                                "differentiable function of the scope")
+        u = self.arguments[0]
+        return _product(_DERIVATIVES[self.name](u), derivatives[0])
+
+
+_PRECEDENCE = {"+": 1, "-": 1, "*": 2, "/": 2, "^": 4}
+
+# operations nested deeper are calculated in an own line of the source
+_MAX_NESTING = 50
+# larger integer powers of numbers are not folded to one number
+_MAX_FOLDED_EXPONENT = 64
+_MAX_FOLDED_BITS = 4096
+_MAX_FACTORIAL = 500
+
+
+def _postorder(expression: _Expression):
+    """Yields the distinct nodes of an expression, every node after its
+    operands. Works without recursion for deeply nested expressions.
+    """
+    done = set()
+    stack = [(expression, False)]
+    while stack:
+        node, expanded = stack.pop()
+        if id(node) in done:
+            continue
+        if expanded:
+            done.add(id(node))
+            yield node
+        else:
+            stack.append((node, True))
+            for e in reversed(node.operands):
+                stack.append((e, False))
+
+
+def _source(expression: _Expression) -> str:
+    """Returns the Python source of a function of x that calculates the
+    expression. Equal subexpressions are calculated once.
+    """
+    indices, keys, nodes, operands = {}, {}, [], []
+    for node in _postorder(expression):
+        key = node._key(), tuple([indices[id(e)] for e in node.operands])
+        if key not in keys:
+            keys[key] = len(nodes)
+            nodes.append(node)
+            operands.append(key[1])
+        indices[id(node)] = keys[key]
+    uses = [0] * len(nodes)
+    for ele in operands:
+        for i in ele:
+            uses[i] += 1
+    lines, code, nesting = [], [], []
+    for i, node in enumerate(nodes):
+        line = node._code([code[j] for j in operands[i]])
+        depth = max([nesting[j] for j in operands[i]], default=0) + 1
+        if operands[i] and (uses[i] > 1 or depth > _MAX_NESTING):
+            lines.append(f"    _{i} = {line}")
+            line, depth = f"_{i}", 0
+        code.append(line)
+        nesting.append(depth)
+    lines.append(f"    return {code[indices[id(expression)]]}")
+    return "def function(x):\n" + "\n".join(lines)
+
+
+def _bounded_power(base: REAL, exponent: REAL) -> REAL:
+    """Returns base ** exponent. Integer powers with large exponents or
+    results are calculated with floats to overflow instead of creating
+    huge integers.
+    """
+    if type(base) == int and type(exponent) == int and (
+            abs(exponent) > _MAX_FOLDED_EXPONENT
+            or abs(base).bit_length() * abs(exponent) > _MAX_FOLDED_BITS):
+        return float(base) ** exponent
+    return base ** exponent
+
+
+def _bounded_factorial(x: int, opt: str = None) -> int:
+    """Returns fac(x). Arguments larger than _MAX_FACTORIAL raise an
+    OverflowError instead of multiplying huge integers.
+    """
+    if x > _MAX_FACTORIAL:
+        raise OverflowError(f"fac({x}) exceeds fac({_MAX_FACTORIAL})")
+    return fac(x, opt)
+
+
+def _is_number(expression: _Expression, value: REAL = None) -> bool:
+    """Checks if the expression is a number (with given value)."""
+    return type(expression) == _Number \
+        and (value is None or expression.value == value)
+
+
+def _is_finite(value: REAL) -> bool:
+    """Checks if a folded constant can be written as number."""
+    return abs(value) < float("inf")
+
+
+def _sum(u: _Expression, v: _Expression) -> _Expression:
+    """Returns u + v with simplifications."""
+    if _is_number(u, 0):
+        return v
+    elif _is_number(v, 0):
+        return u
+    elif _is_number(u) and _is_number(v) \
+            and _is_finite(u.value + v.value):
+        return _Number(u.value + v.value)
+    elif type(v) == _Negation:
+        return _difference(u, v.operand)
+    return _Operation("+", u, v)
+
+
+def _difference(u: _Expression, v: _Expression) -> _Expression:
+    """Returns u - v with simplifications."""
+    if _is_number(v, 0):
+        return u
+    elif _is_number(u, 0):
+        return _negative(v)
+    elif _is_number(u) and _is_number(v) \
+            and _is_finite(u.value - v.value):
+        return _Number(u.value - v.value)
+    elif type(v) == _Negation:
+        return _sum(u, v.operand)
+    return _Operation("-", u, v)
+
+
+def _product(u: _Expression, v: _Expression) -> _Expression:
+    """Returns u * v with simplifications."""
+    if _is_number(u, 0) or _is_number(v, 0):
+        return _Number(0)
+    elif _is_number(u, 1):
+        return v
+    elif _is_number(v, 1):
+        return u
+    elif _is_number(u) and _is_number(v) \
+            and _is_finite(u.value * v.value):
+        return _Number(u.value * v.value)
+    elif _is_number(u, -1):
+        return _negative(v)
+    elif _is_number(v, -1):
+        return _negative(u)
+    return _Operation("*", u, v)
+
+
+def _quotient(u: _Expression, v: _Expression) -> _Expression:
+    """Returns u / v with simplifications."""
+    if _is_number(u, 0) and not _is_number(v, 0):
+        return _Number(0)
+    elif _is_number(v, 1):
+        return u
+    elif _is_number(u) and _is_number(v) and not _is_number(v, 0) \
+            and _is_finite(u.value / v.value):
+        return _Number(u.value / v.value)
+    return _Operation("/", u, v)
+
+
+def _power(u: _Expression, v: _Expression) -> _Expression:
+    """Returns u ^ v with simplifications."""
+    if _is_number(v, 0):
+        return _Number(1)
+    elif _is_number(v, 1):
+        return u
+    elif _is_number(u) and _is_number(v) and (
+            type(v.value) != int or abs(v.value) <= _MAX_FOLDED_EXPONENT
+            and (type(u.value) != int or abs(u.value).bit_length()
+                 * abs(v.value) <= _MAX_FOLDED_BITS)):
+        try:
+            value = u.value ** v.value
+        except (ZeroDivisionError, OverflowError):
+            return _Operation("^", u, v)
+        if _is_finite(value):
+            return _Number(value)
+    return _Operation("^", u, v)
+
+
+def _negative(u: _Expression) -> _Expression:
+    """Returns -u with simplifications."""
+    if _is_number(u):
+        return _Number(-u.value)
+    elif type(u) == _Negation:
+        return u.operand
+    return _Negation(u)
+
+
+def _root_of(u: _Expression) -> _Expression:
+    """Returns 1 / u^0.5."""
+    return _quotient(_Number(1), _power(u, _Number(0.5)))
+
+
+_DERIVATIVES = {
+    "sin": lambda u: _Call("cos", (u,)),
+    "cos": lambda u: _negative(_Call("sin", (u,))),
+    "tan": lambda u: _quotient(_Number(1),
+                               _power(_Call("cos", (u,)), _Number(2))),
+    "arcsin": lambda u: _root_of(
+        _difference(_Number(1), _power(u, _Number(2)))
+    ),
+    "arccos": lambda u: _negative(_root_of(
+        _difference(_Number(1), _power(u, _Number(2)))
+    )),
+    "arctan": lambda u: _quotient(_Number(1),
+                                  _sum(_Number(1), _power(u, _Number(2)))),
+    "sinh": lambda u: _Call("cosh", (u,)),
+    "cosh": lambda u: _Call("sinh", (u,)),
+    "tanh": lambda u: _quotient(_Number(1),
+                                _power(_Call("cosh", (u,)), _Number(2))),
+    "arsinh": lambda u: _root_of(_sum(_power(u, _Number(2)), _Number(1))),
+    "arccosh": lambda u: _root_of(
+        _difference(_power(u, _Number(2)), _Number(1))
+    ),
+    "artanh": lambda u: _quotient(
+        _Number(1), _difference(_Number(1), _power(u, _Number(2)))
+    ),
+    "ln": lambda u: _quotient(_Number(1), u),
+    "sgn": lambda u: _Number(0),
+    "abs": lambda u: _Call("sgn", (u,)),
+}
+
+_OPERATORS = {ast.Add: _sum, ast.Sub: _difference, ast.Mult: _product,
+              ast.Div: _quotient, ast.Pow: _power}
+
+
+def _parse(term: str) -> _Expression:
+    """Parses a term in Python syntax to an expression tree. Only numbers,
+    x, names, calls and arithmetic operations are accepted.
+    """
+    try:
+        return _convert(ast.parse(term, mode="eval").body)
+    except (SyntaxError, ValueError, RecursionError, MemoryError):
+        raise ArgumentError(term, "function term")
+
+
+def _convert(root: ast.AST) -> _Expression:
+    """Converts a Python syntax tree to an expression. Works without
+    recursion for long terms.
+    """
+    expressions = {}
+    stack = [(root, False)]
+    while stack:
+        node, expanded = stack.pop()
+        operands = _operands(node)
+        if expanded:
+            expressions[id(node)] = _build(
+                node, [expressions[id(e)] for e in operands]
+            )
+        else:
+            stack.append((node, True))
+            for e in reversed(operands):
+                stack.append((e, False))
+    return expressions[id(root)]
+
+
+def _operands(node: ast.AST) -> tuple:
+    """Returns the operand nodes of an accepted node of a Python syntax
+    tree. Raises ArgumentError for other nodes.
+    """
+    if type(node) == ast.BinOp and type(node.op) in _OPERATORS:
+        return node.left, node.right
+    elif type(node) == ast.UnaryOp and type(node.op) in (ast.USub, ast.UAdd):
+        return node.operand,
+    elif type(node) == ast.Constant \
+            and type(node.value) in (int, float, complex):
+        if not _is_finite(node.value):
+            raise ArgumentError(node.value, "finite number")
+        return ()
+    elif type(node) == ast.Name and not node.id.startswith("_"):
+        return ()
+    elif type(node) == ast.Call and type(node.func) == ast.Name \
+            and not node.func.id.startswith("_") and not node.keywords:
+        return tuple(node.args)
+    raise ArgumentError(type(node).__name__, "arithmetic expression")
+
+
+def _build(node: ast.AST, operands: list) -> _Expression:
+    """Returns the expression of a node of a Python syntax tree with
+    given operand expressions.
+    """
+    if type(node) == ast.BinOp:
+        return _OPERATORS[type(node.op)](*operands)
+    elif type(node) == ast.UnaryOp and type(node.op) == ast.USub:
+        return _negative(operands[0])
+    elif type(node) == ast.UnaryOp:
+        return operands[0]
+    elif type(node) == ast.Constant:
+        return _Number(node.value)
+    elif type(node) == ast.Name:
+        return _Variable() if node.id == "x" else _Name(node.id)
+    return _Call(node.func.id, tuple(operands))
+
+
+def _globals(expression: _Expression, scope: dict) -> dict:
+    """Returns the globals for the compiled expression. Contains only the
+    names of the scope used by the expression, the bounded power and no
+    builtins. fac is replaced by the bounded factorial.
+    """
+    namespace = {"__builtins__": {}, "_power": _bounded_power}
+    for node in _postorder(expression):
+        if type(node) in (_Name, _Call):
+            if node.name not in scope:
+                raise ArgumentError(node.name, "name of the scope")
+            value = scope[node.name]
+            namespace[node.name] = _bounded_factorial if value is fac \
+                else value
+    return namespace
+
+
+class _Counter:
+    """Function wrapper that counts the evaluations."""
+
+    __slots__ = ("function", "evaluations")
+
+    def __init__(self, function):
+        self.function = function
+        self.evaluations = 0
+
+    def __call__(self, x: REAL) -> REAL:
+        self.evaluations += 1
+        return self.function(x)
+
+
+_KRONROD_NODES = (0.991455371120812639206854697526329,
+                  0.949107912342758524526189684047851,
+                  0.864864423359769072789712788640926,
+                  0.741531185599394439863864773280788,
+                  0.586087235467691130294144845693013,
+                  0.405845151377397166906606412076961,
+                  0.207784955007898467600689403773245)
+_KRONROD_WEIGHTS = (0.022935322010529224963732008058970,
+                    0.063092092629978553290700663189204,
+                    0.104790010322250183839876322541518,
+                    0.140653259715525918745189590510238,
+                    0.169004726639267902826583426598550,
+                    0.190350578064785409913256402421014,
+                    0.204432940075298892414161999234649,
+                    0.209482141084727828012999174891714)
+_GAUSS_WEIGHTS = (0.129484966168869693270611432679082,
+                  0.279705391489276667901467771423780,
+                  0.381830050505118944950369775488975,
+                  0.417959183673469387755102040816327)
+
+
+def _kronrod(f, a: float, b: float) -> tuple:
+    """Returns the 15 point Kronrod value on [a, b] and the difference
+    to the embedded 7 point Gauss value as error estimate.
+    """
+    center, radius = (a + b) / 2, (b - a) / 2
+    f_center = f(center)
+    kronrod = _KRONROD_WEIGHTS[7] * f_center
+    gauss = _GAUSS_WEIGHTS[3] * f_center
+    for i, node in enumerate(_KRONROD_NODES):
+        pair = f(center - radius * node) + f(center + radius * node)
+        kronrod += _KRONROD_WEIGHTS[i] * pair
+        if i % 2 == 1:
+            gauss += _GAUSS_WEIGHTS[i // 2] * pair
+    return kronrod * radius, abs((kronrod - gauss) * radius)
+
+
+def _gauss_kronrod(f, a: float, b: float, abs_tol: float, rel_tol: float,
+                   max_evaluations: int) -> NumericalResult:
+    """Adaptive Gauss-Kronrod (7/15) integration. Bisects the interval
+    with the largest error estimate until the tolerance is reached.
+    """
+    value, error = _kronrod(f, a, b)
+    intervals = [(-error, a, b, value)]
+    total_value, total_error = value, error
+    evaluations, iterations = 15, 1
+    while total_error > max(abs_tol, rel_tol * abs(total_value)) \
+            and evaluations + 30 <= max_evaluations:
+        error, left, right, value = heapq.heappop(intervals)
+        middle = (left + right) / 2
+        if not left < middle < right:
+            heapq.heappush(intervals, (error, left, right, value))
+            break
+        total_value -= value
+        total_error += error
+        for begin, end in ((left, middle), (middle, right)):
+            value, error = _kronrod(f, begin, end)
+            heapq.heappush(intervals, (-error, begin, end, value))
+            total_value += value
+            total_error += error
+        evaluations += 30
+        iterations += 1
+    total_value = sum([e[3] for e in intervals])
+    total_error = sum([-e[0] for e in intervals])
+    return NumericalResult(
+        total_value, total_error, evaluations, iterations,
+        total_error <= max(abs_tol, rel_tol * abs(total_value))
+    )
+
+
+def _romberg(f, a: float, b: float, abs_tol: float, rel_tol: float,
+             max_evaluations: int) -> NumericalResult:
+    """Romberg integration. Halves the step of the trapeze rule and
+    extrapolates with Richardson's method.
+    """
+    h = b - a
+    rows = [[(f(a) + f(b)) * h / 2]]
+    evaluations, error, n = 2, None, 1
+    while evaluations + n <= max_evaluations:
+        h /= 2
+        midpoints = sum([f(a + (2 * i + 1) * h) for i in range(n)])
+        evaluations += n
+        n *= 2
+        row = [rows[-1][0] / 2 + h * midpoints]
+        for k in range(1, len(rows) + 1):
+            row.append(row[k-1] + (row[k-1] - rows[-1][k-1]) / (4 ** k - 1))
+        error = abs(row[-1] - rows[-1][-1])
+        rows.append(row)
+        if len(rows) > 4 and error <= max(abs_tol, rel_tol * abs(row[-1])):
+            return NumericalResult(row[-1], error, evaluations, len(rows))
+    return NumericalResult(rows[-1][-1], error, evaluations, len(rows), False)
+
+
+def _tanh_sinh(f, a: float, b: float, abs_tol: float, rel_tol: float,
+               max_evaluations: int) -> NumericalResult:
+    """Tanh-sinh (double exponential) integration. The function is not
+    evaluated at the endpoints, so it may be singular there.
+    """
+    radius = (b - a) / 2
+
+    def terms(t: float) -> float:
+        """Returns weighted function values at -t and t."""
+        u = pi / 2 * (_e ** t - _e ** -t) / 2
+        distance = 2 * radius / (_e ** (2 * u) + 1)
+        if not a < a + distance < b:
+            return 0
+        weight = pi / 2 * (_e ** t + _e ** -t) / 2 \
+            * 4 / (_e ** u + _e ** -u) ** 2
+        if t == 0:
+            return weight * f(a + distance)
+        return weight * (f(a + distance) + f(b - distance))
+
+    h = 1.
+    t_max = 4
+    value = terms(0) + sum([terms(k * h) for k in range(1, int(t_max / h))])
+    evaluations = 1 + 2 * (int(t_max / h) - 1)
+    total = value * h * radius
+    error = None
+    level = 0
+    while evaluations + 4 * t_max / h <= max_evaluations:
+        level += 1
+        h /= 2
+        steps = range(1, int(t_max / h), 2)
+        value += sum([terms(k * h) for k in steps])
+        evaluations += 2 * len(steps)
+        new_total = value * h * radius
+        error = abs(new_total - total)
+        total = new_total
+        if level > 2 and error <= max(abs_tol, rel_tol * abs(total)):
+            return NumericalResult(total, error, evaluations, level + 1)
+    return NumericalResult(total, error, evaluations, level + 1, False)
+
+
+_INTEGRATION_METHODS = {"gauss-kronrod": _gauss_kronrod,
+                        "romberg": _romberg,
+                        "tanh-sinh": _tanh_sinh}
+
+
+def _brent(f, a: float, b: float, fa: float, fb: float, abs_tol: float,
+           rel_tol: float, max_iterations: int) -> NumericalResult:
+    """Brent's method. Finds the root between a and b with f(a) and f(b)
+    of different signs. Uses inverse quadratic interpolation and secant
+    steps and falls back to bisection if they do not converge fast.
+    """
+    c, fc = a, fa
+    d = e = b - a
+    for iteration in range(1, max_iterations + 1):
+        if fb * fc > 0:
+            c, fc = a, fa
+            d = e = b - a
+        if abs(fc) < abs(fb):
+            a, b, c = b, c, b
+            fa, fb, fc = fb, fc, fb
+        tol = max(abs_tol, rel_tol * abs(b)) / 2
+        m = (c - b) / 2
+        if abs(m) <= tol or fb == 0:
+            return NumericalResult(b, abs(m), 0, iteration)
+        if abs(e) >= tol and abs(fa) > abs(fb):
+            s = fb / fa
+            if a == c:
+                p = 2 * m * s
+                q = 1 - s
+            else:
+                q, r = fa / fc, fb / fc
+                p = s * (2 * m * q * (q - r) - (b - a) * (r - 1))
+                q = (q - 1) * (r - 1) * (s - 1)
+            if p > 0:
+                q = -q
+            else:
+                p = -p
+            if 2 * p < min(3 * m * q - abs(tol * q), abs(e * q)):
+                e, d = d, p / q
+            else:
+                d = e = m
+        else:
+            d = e = m
+        a, fa = b, fb
+        if abs(d) > tol:
+            b += d
+        else:
+            b += tol if m > 0 else -tol
+        fb = f(b)
+    return NumericalResult(b, abs(c - b) / 2, 0, max_iterations, False)
+
+
+def _illinois(f, a: float, b: float, fa: float, fb: float, abs_tol: float,
+              rel_tol: float, max_iterations: int) -> NumericalResult:
+    """Illinois method. Regula falsi that halves the function value of
+    an endpoint that is kept twice in a row.
+    """
+    side = 0
+    c = b
+    for iteration in range(1, max_iterations + 1):
+        c = (a * fb - b * fa) / (fb - fa)
+        fc = f(c)
+        if fc == 0:
+            return NumericalResult(c, 0, 0, iteration)
+        if fc * fb > 0:
+            b, fb = c, fc
+            if side == -1:
+                fa /= 2
+            side = -1
+        else:
+            a, fa = c, fc
+            if side == 1:
+                fb /= 2
+            side = 1
+        if abs(b - a) <= max(abs_tol, rel_tol * abs(c)):
+            return NumericalResult(c, abs(b - a), 0, iteration)
+    return NumericalResult(c, abs(b - a), 0, max_iterations, False)
+
+
+_ROOT_METHODS = {"brent": _brent,
+                 "illinois": _illinois}
+
+
+def _newton(values, x: float, abs_tol: float, rel_tol: float,
+            max_iterations: int) -> NumericalResult:
+    """Newton's method x_{n+1} = x_n - f(x_n) / f'(x_n). values(x) returns
+    f(x) and f'(x). Stops if the step is smaller than abs_tol or rel_tol
+    times x. Steps away by 1e-2 if f'(x_n) is 0.
+    """
+    step = None
+    for iteration in range(1, max_iterations + 1):
+        y, slope = values(x)
+        if slope == 0:
+            x += 1e-2
+            continue
+        step = y / slope
+        x -= step
+        if abs(step) <= max(abs_tol, rel_tol * abs(x)):
+            return NumericalResult(x, abs(step), 0, iteration)
+    return NumericalResult(x, None if step is None else abs(step), 0,
+                           max_iterations, False)
+
+
+def _golden_section(f, a: float, b: float, x: float, fx: float,
+                    abs_tol: float, rel_tol: float,
+                    max_iterations: int) -> NumericalResult:
+    """Golden-section search for the minimum in the bracket [a, b] with
+    a < x < b and f(x) smaller than at a and b.
+    """
+    golden = (3 - 5 ** 0.5) / 2
+    for iteration in range(1, max_iterations + 1):
+        if b - a <= 2 * max(abs_tol, rel_tol * abs(x)):
+            return NumericalResult(x, (b - a) / 2, 0, iteration)
+        if x - a > b - x:
+            u = x - golden * (x - a)
+        else:
+            u = x + golden * (b - x)
+        fu = f(u)
+        if fu <= fx:
+            if u < x:
+                b = x
+            else:
+                a = x
+            x, fx = u, fu
+        elif u < x:
+            a = u
+        else:
+            b = u
+    return NumericalResult(x, (b - a) / 2, 0, max_iterations, False)
+
+
+def _brent_minimum(f, a: float, b: float, x: float, fx: float,
+                   abs_tol: float, rel_tol: float,
+                   max_iterations: int) -> NumericalResult:
+    """Brent's method for the minimum in the bracket [a, b] with a < x < b
+    and f(x) smaller than at a and b. Uses parabolic interpolation through
+    the best three points and golden-section steps if it fails.
+    """
+    golden = (3 - 5 ** 0.5) / 2
+    w = v = x
+    fw = fv = fx
+    d = e = 0
+    for iteration in range(1, max_iterations + 1):
+        m = (a + b) / 2
+        tol = max(abs_tol, rel_tol * abs(x))
+        if abs(x - m) <= 2 * tol - (b - a) / 2:
+            return NumericalResult(x, (b - a) / 2, 0, iteration)
+        parabolic = False
+        if abs(e) > tol:
+            r = (x - w) * (fx - fv)
+            q = (x - v) * (fx - fw)
+            p = (x - v) * q - (x - w) * r
+            q = 2 * (q - r)
+            if q > 0:
+                p = -p
+            else:
+                q = -q
+            if abs(p) < abs(q * e / 2) and q * (a - x) < p < q * (b - x):
+                e, d = d, p / q
+                if x + d - a < 2 * tol or b - x - d < 2 * tol:
+                    d = tol if x < m else -tol
+                parabolic = True
+        if not parabolic:
+            e = b - x if x < m else a - x
+            d = golden * e
+        if abs(d) >= tol:
+            u = x + d
+        else:
+            u = x + (tol if d > 0 else -tol)
+        fu = f(u)
+        if fu <= fx:
+            if u < x:
+                b = x
+            else:
+                a = x
+            v, fv, w, fw, x, fx = w, fw, x, fx, u, fu
+        else:
+            if u < x:
+                a = u
+            else:
+                b = u
+            if fu <= fw or w == x:
+                v, fv, w, fw = w, fw, u, fu
+            elif fu <= fv or v == x or v == w:
+                v, fv = u, fu
+    return NumericalResult(x, (b - a) / 2, 0, max_iterations, False)
+
+
+_MINIMUM_METHODS = {"brent": _brent_minimum,
+                    "golden": _golden_section}
 
 
 class Function:
@@ -48,53 +1071,91 @@ class Function:
         self.term = arg
         self._arg_scope = _scope
 
+    @classmethod
+    def _from_expression(cls, expression: _Expression,
+                         scope: dict) -> 'Function':
+        """Creates a function from an expression tree. The term is
+        created on first use.
+        """
+        function = object.__new__(cls)
+        function.term = None
+        function._expression = expression
+        function._arg_scope = scope
+        return function
+
+    @property
+    def term(self) -> str:
+        """The function term as string."""
+        if self._term is None:
+            self._term = str(self._expression)
+        return self._term
+
+    @term.setter
+    def term(self, value: str):
+        self._term = value
+        self._evaluator = None
+        self._expression = None
+        self._derivative = None
+
     def __repr__(self) -> str:
         """Returns string representation"""
         return f"f(x) = {self.term}"
 
     def __add__(self, other: Union[REAL, 'Function']) -> 'Function':
         """Adds two functions"""
-        if type(other) == Function:
-            ret_formula = f"{self.term} + {other.term}"
-        else:
-            ret_formula = f"{self.term} + {other}"
-        return Function(ret_formula)
+        return self._combine(_sum(self._tree(), self._operand(other)))
 
     __radd__ = __add__
 
-    def __sub__(self, other: 'Function') -> 'Function':
+    def __sub__(self, other: REAL | 'Function') -> 'Function':
         """Subtracts two functions"""
-        ret_formula = f"{self.term} - ({other.term})"
-        return Function(ret_formula)
+        return self._combine(_difference(self._tree(), self._operand(other)))
 
     def __mul__(self, other: REAL | 'Function') -> 'Function':
         """Multiplies two functions."""
         if type(other) == Function:
-            ret_formula = f"({self.term}) * ({other.term})"
-        else:
-            ret_formula = f"{other} * ({self.term})"
-        return Function(ret_formula)
+            return self._combine(_product(self._tree(), other._tree()))
+        return self._combine(_product(self._operand(other), self._tree()))
 
     __rmul__ = __mul__
 
     def __truediv__(self, other: REAL | 'Function') -> 'Function':
         """Divides two functions or a function and a REAL."""
-        if type(other) == Function:
-            ret_formula = f"({self.term}) / ({other.term})"
-        else:
-            ret_formula = f"({self.term}) / {other}"
-        return Function(ret_formula)
+        return self._combine(_quotient(self._tree(), self._operand(other)))
 
     def __rtruediv__(self, other: REAL | 'Function') -> 'Function':
         """Divides a REAL by a function."""
-        return Function(f"{other} / ({self.term})")
+        return self._combine(_quotient(self._operand(other), self._tree()))
 
     def __neg__(self) -> 'Function':
         """Returns negative function"""
-        return Function(f"-({self.term})")
+        return self._combine(_negative(self._tree()))
+
+    def _tree(self) -> _Expression:
+        """Returns the term as expression tree. The term is parsed once."""
+        if self._expression is None:
+            self._expression = _parse(self._python_term())
+        return self._expression
+
+    @staticmethod
+    def _operand(other: REAL | 'Function') -> _Expression:
+        """Returns the expression tree of a function or number."""
+        if type(other) == Function:
+            return other._tree()
+        elif type(other) in (int, float, complex):
+            return _Number(other)
+        return _parse(str(other))
+
+    def _combine(self, expression: _Expression) -> 'Function':
+        """Returns a function of an expression with the scope of self."""
+        return Function._from_expression(expression, self._arg_scope)
 
     def replace(self, value: REAL) -> str:
         """Replaces intuitive elements with correct ones."""
+        return self._python_term().replace("x", f"({value})")
+
+    def _python_term(self) -> str:
+        """Replaces intuitive elements with correct ones. Keeps x."""
         return_string = self.term.replace("^", "**")
         i = 0
         while True:
@@ -107,100 +1168,304 @@ class Function:
             if return_string[i-1] in "0123456789":
                 return_string = f"{return_string[:i]}*{return_string[i:]}"
             i += 1
-        return return_string.replace("x", f"({value})")
+        return return_string
 
     def set_scope(self, scope: dict):
         """Sets a new dict as scope."""
         self._arg_scope = scope
+        self._evaluator = None
+        self._derivative = None
 
     def append_scope(self, scope: dict):
         """Appends dict to eval() scope. If appended scope contains elements
         that are already defined the appended elements are preferred.
         """
         self._arg_scope = {**self._arg_scope, **scope}
+        self._evaluator = None
+        self._derivative = None
+
+    def _compile(self):
+        """Returns the term compiled to a function of x. The term is
+        compiled once and again only if term or scope change. Equal
+        subexpressions are calculated once. The code is generated from
+        the expression tree, so only arithmetic and names of the scope
+        can be executed.
+        """
+        if self._evaluator is None:
+            expression = self._tree()
+            code = compile(_source(expression),
+                           "<avmath.analysis.Function>", "exec")
+            namespace = {}
+            exec(code, _globals(expression, self._arg_scope), namespace)
+            self._evaluator = namespace["function"]
+        return self._evaluator
 
     def at(self, value: REAL) -> REAL:
         """Get function value at specific x value."""
-        formula_at = self.replace(value)
-        return eval(formula_at, self._arg_scope)
+        return self._compile()(value)
 
-    def max(self, xmin: REAL, xmax: REAL, steps: int = 1000) -> list:
-        """Finds maxima of a function using changed newton method:
-        x_{n+1} = x_n - f'(x_n) / f''(x_n)
+    def evaluate(self, values: list | tuple | array) -> list | array:
+        """Returns the function values for a sequence of x values.
+        Returns an array if an array is given.
         """
-        sgn_step = (xmax - xmin) / steps
-        x_pos = xmin
-        candidates = []
-        for i in range(steps):
-            if sgn(self.derivative(x_pos))\
-                    != sgn(self.derivative(x_pos+sgn_step)):
-                candidates.append(x_pos)
-            x_pos += sgn_step
-        return_list = []
-        for ele in candidates:
-            value = Point(self.newton_method_extrema(ele),
-                          self.at(self.newton_method_extrema(ele)))
-            if value not in return_list and self.second_derivative(ele) < 0:
-                return_list.append(value)
-        return return_list
-
-    def min(self, xmin: REAL, xmax: REAL, steps: int = 1000) -> list:
+        function = self._compile()
+        if type(values) == array:
+            return array("d", map(function, values))
+        return list(map(function, values))
+
+    def __call__(self, value: REAL | list | tuple | array):
+        """Returns the function value at x or the function values
+        for a sequence of x values.
+        """
+        if type(value) in (list, tuple, array):
+            return self.evaluate(value)
+        return self.at(value)
+
+    def max(self, xmin: REAL, xmax: REAL,
+            steps: int = 1000) -> 'PointArray':
+        """Finds maxima of a function in a given domain. The maxima are
+        refined by Newton's method with automatic differentiation.
+        """
+        return PointArray(*[self._polish(e, (xmax - xmin) / steps) for e
+                            in self.maximize(xmin, xmax, steps).value]
+                          ).unique()
+
+    def min(self, xmin: REAL, xmax: REAL,
+            steps: int = 1000) -> 'PointArray':
         """Finds minima of a function in a given domain."""
-        neg_func = -self
-        return [e.negative_y() for e in neg_func.max(xmin, xmax, steps)]
+        return PointArray(*[self._polish(e, (xmax - xmin) / steps) for e
+                            in self.minimize(xmin, xmax, steps).value]
+                          ).unique()
+
+    def _polish(self, point: Point, width: REAL) -> Point:
+        """Refines an extremum with Newton's method on the derivative.
+        Keeps the point if the method leaves the bracket of given width.
+        """
+        try:
+            result = self.newton_extrema(point[0], max_iterations=10)
+        except (ArithmeticError, ArgumentError):
+            return point
+        if result.converged and abs(result.value - point[0]) <= width:
+            return Point(result.value, self.at(result.value))
+        return point
+
+    def maximize(self,
+                 xmin: REAL,
+                 xmax: REAL,
+                 steps: int = 100,
+                 method: str = "brent",
+                 abs_tol: float = 1.5e-8,
+                 rel_tol: float = 1.5e-8,
+                 max_iterations: int = 100) -> NumericalResult:
+        """Finds the local maxima between xmin and xmax like `minimize`."""
+        result = self._minimize(xmin, xmax, steps, method, abs_tol, rel_tol,
+                                max_iterations, -1)
+        result.value = [e.negative_y() for e in result.value]
+        return result
+
+    def minimize(self,
+                 xmin: REAL,
+                 xmax: REAL,
+                 steps: int = 100,
+                 method: str = "brent",
+                 abs_tol: float = 1.5e-8,
+                 rel_tol: float = 1.5e-8,
+                 max_iterations: int = 100) -> NumericalResult:
+        """Finds the local minima between xmin and xmax without derivatives.
+        The domain is sampled in steps and every grid point smaller than
+        its neighbours brackets a minimum, which is refined by "brent"
+        (parabolic interpolation) or "golden" (golden-section search).
+        Returns a NumericalResult with the list of minima as Points.
+        """
+        return self._minimize(xmin, xmax, steps, method, abs_tol, rel_tol,
+                              max_iterations, 1)
+
+    def _minimize(self, xmin: REAL, xmax: REAL, steps: int, method: str,
+                  abs_tol: float, rel_tol: float, max_iterations: int,
+                  sign: int) -> NumericalResult:
+        """Finds the minima of sign * f."""
+        if method not in _MINIMUM_METHODS:
+            raise ArgumentError(method, tuple(_MINIMUM_METHODS))
+        compiled = self._compile()
+        function = _Counter(lambda x: sign * compiled(x))
+        sgn_step = (xmax - xmin) / steps
+        x_values = [xmin + i * sgn_step for i in range(steps + 1)]
+        y_values = list(map(function, x_values))
+        minima = PointArray()
+        error, iterations, converged = 0, 0, True
+        for i in range(1, steps):
+            if not y_values[i-1] > y_values[i] <= y_values[i+1]:
+                continue
+            result = _MINIMUM_METHODS[method](
+                function, x_values[i-1], x_values[i+1], x_values[i],
+                y_values[i], abs_tol, rel_tol, max_iterations
+            )
+            iterations += result.iterations
+            converged = converged and result.converged
+            if minima and abs(result.value - minima[-1][0]) \
+                    <= 2 * max(abs_tol, rel_tol * abs(minima[-1][0])):
+                continue
+            error = max(error, result.error)
+            minima.append(Point(result.value, sign * compiled(result.value)))
+        return NumericalResult(minima, error, function.evaluations,
+                               iterations, converged)
 
     def root(self, xmin: REAL, xmax: REAL, step: int = 1000) -> list:
         """Find roots of functions with f(x) = 0.
         Returns only x-coordinate.
         """
-        sgn_step = (xmax - xmin) / step
-        x_pos = xmin
-        candidates = []
-        for i in range(step):
-            if sgn(self.at(x_pos)) != sgn(self.at(x_pos + sgn_step)):
-                candidates.append(x_pos)
-            x_pos += sgn_step
-        return_list = []
-        for element in candidates:
-            if not self.newton_method(element) in return_list:
-                return_list.append(self.newton_method(element))
-        return return_list
+        return self.solve(xmin, xmax, step).value
+
+    def solve(self,
+              xmin: REAL,
+              xmax: REAL,
+              steps: int = 1000,
+              method: str = "brent",
+              abs_tol: float = 1e-12,
+              rel_tol: float = 1e-12,
+              max_iterations: int = 100) -> NumericalResult:
+        """Finds the roots between xmin and xmax. The domain is scanned in
+        steps for sign changes, which are refined by a bracketing method
+        ("brent" or "illinois") reusing the values of the scan.
+        Returns a NumericalResult with the list of roots as value and the
+        largest error estimate.
+        """
+        if method not in _ROOT_METHODS:
+            raise ArgumentError(method, tuple(_ROOT_METHODS))
+        function = _Counter(self._compile())
+        sgn_step = (xmax - xmin) / steps
+        x_values = [xmin + i * sgn_step for i in range(steps + 1)]
+        y_values = list(map(function, x_values))
+        roots = []
+        error, iterations, converged = 0, 0, True
+        for i in range(steps + 1):
+            if y_values[i] == 0:
+                result = NumericalResult(x_values[i], 0)
+            elif i < steps and y_values[i] * y_values[i+1] < 0:
+                result = _ROOT_METHODS[method](
+                    function, x_values[i], x_values[i+1], y_values[i],
+                    y_values[i+1], abs_tol, rel_tol, max_iterations
+                )
+                # a sign change at a pole is no root
+                if abs(function(result.value)) \
+                        > max(abs(y_values[i]), abs(y_values[i+1])):
+                    continue
+            else:
+                continue
+            iterations += result.iterations
+            converged = converged and result.converged
+            if roots and abs(result.value - roots[-1]) \
+                    <= 2 * max(abs_tol, rel_tol * abs(roots[-1])):
+                continue
+            error = max(error, result.error)
+            roots.append(result.value)
+        return NumericalResult(roots, error, function.evaluations,
+                               iterations, converged)
 
     def newton_method(self, x_n: REAL, steps: int = 50) -> float:
         """Newton's method to find root of function from given point x_n.
         x_{n+1} = x_n - f(x_n) / f'(x_n)
         """
-        for _ in range(steps):
-            if self.derivative(x_n) != 0:
-                x_n = x_n - self.at(x_n) / self.derivative(x_n)
-            else:
-                x_n += 1e-2
-        return x_n
+        return self.newton(x_n, max_iterations=steps).value
 
     def newton_method_extrema(self, x_n, steps: int = 50) -> float:
         """Method to find extrema of a function. Derived from Newton's method:
          x_{n+1} = x_n - f'(x_n) / f''(x_n)"""
-        for _ in range(steps):
-            if self.second_derivative(x_n) != 0:
-                x_n = x_n - self.derivative(x_n) / self.second_derivative(x_n)
-            else:
-                x_n += 1e-2
-        return x_n
+        return self.newton_extrema(x_n, max_iterations=steps).value
+
+    def newton(self,
+               x_n: REAL,
+               abs_tol: float = 1e-12,
+               rel_tol: float = 1e-12,
+               max_iterations: int = 50) -> NumericalResult:
+        """Newton's method to find a root from given point x_n. Stops if
+        the step is smaller than abs_tol or rel_tol times x_n. f and f' are
+        calculated in one evaluation with dual numbers.
+        Returns a NumericalResult with the iteration count.
+        """
+        values = _Counter(lambda x: self._jet(x)[:2])
+        result = _newton(values, x_n, abs_tol, rel_tol, max_iterations)
+        result.evaluations = values.evaluations
+        return result
+
+    def newton_extrema(self,
+                       x_n: REAL,
+                       abs_tol: float = 1e-12,
+                       rel_tol: float = 1e-12,
+                       max_iterations: int = 50) -> NumericalResult:
+        """Newton's method applied to the derivative to find an extremum
+        from given point x_n. Stops like `newton`.
+        """
+        values = _Counter(lambda x: self._jet(x)[1:])
+        result = _newton(values, x_n, abs_tol, rel_tol, max_iterations)
+        result.evaluations = values.evaluations
+        return result
+
+    def diff(self) -> 'Function':
+        """Returns the derivative as function. The term is differentiated
+        symbolically. Raises ArgumentError if the term contains functions
+        that cannot be differentiated.
+        """
+        if self._derivative is None:
+            self._derivative = self._combine(self._tree().derivative())
+        return self._derivative
+
+    def dual(self, x: REAL) -> Dual:
+        """Returns f(x), f'(x) and f''(x) as Dual calculated in one
+        evaluation by automatic differentiation. Raises TypeError or
+        ArgumentError if a function of the scope does not support Dual.
+        """
+        result = self._compile()(Dual(x, 1))
+        if type(result) != Dual:
+            return Dual(result)
+        return result
+
+    def _jet(self, x: REAL) -> tuple:
+        """Returns f(x), f'(x) and f''(x). Uses finite differences if the
+        term does not support dual numbers or the derivative is not
+        defined for them.
+        """
+        try:
+            result = self.dual(x)
+            return result.value, result.first, result.second
+        except (TypeError, ArithmeticError, ArgumentError):
+            return self.at(x), self._difference(x), \
+                self.second_derivative(x, 1e-5)
 
     def derivative(self, x: REAL, h=None) -> float:
-        """Returns derivative of a function.
+        """Returns derivative of a function. Uses automatic differentiation
+        if no h is given and the term supports dual numbers. Else uses
+        finite differences.
+        """
+        if h is None:
+            try:
+                return self.dual(x).first
+            except (TypeError, ArithmeticError, ArgumentError):
+                pass
+        return self._difference(x, h)
+
+    def _difference(self, x: REAL, h=None) -> float:
+        """Returns the derivative calculated by finite differences.
         Uses an algorithm to calculate the best h."""
+        y = self.at(x)
         if not h:
-            if self.second_derivative(x) < 1e-3 or self.at(x) == 0:
+            curvature = self.second_derivative(x, 1e-5)
+            if curvature < 1e-3 or y == 0:
                 h = eps ** (1 / 3)
             else:
-                h = 2 * (eps * abs(self.at(x))
-                         / abs(self.second_derivative(x))) ** 0.5
-        return (4 * self.at(x + h / 2) - 3 * self.at(x) - self.at(x + h)) / h
+                h = 2 * (eps * abs(y) / abs(curvature)) ** 0.5
+        return (4 * self.at(x + h / 2) - 3 * y - self.at(x + h)) / h
 
-    def second_derivative(self, x: REAL, h=1e-5) -> float:
-        """Returns the second derivative of a formula.
-        There may be better h than default instruction."""
+    def second_derivative(self, x: REAL, h=None) -> float:
+        """Returns the second derivative of a formula. Uses automatic
+        differentiation if no h is given and the term supports dual
+        numbers. Else uses finite differences with h=1e-5.
+        """
+        if h is None:
+            try:
+                return self.dual(x).second
+            except (TypeError, ArithmeticError, ArgumentError):
+                h = 1e-5
         return (self.at(x + h) - 2 * self.at(x) + self.at(x - h)) / h ** 2
 
     def num_dif(self, x: REAL, h: REAL = 1e-5) -> float:
@@ -227,10 +1492,9 @@ class Function:
         Use Function.integral instead.
         """
         res = (b - a) / n
-        term = 0
-        for i in range(n):
-            xi = a + i * (b - a) / n + (b - a) / (2 * n)
-            term += self.at(xi)
+        term = sum(self.evaluate(
+            [a + i * (b - a) / n + (b - a) / (2 * n) for i in range(n)]
+        ))
         res *= term
         return res
 
@@ -242,69 +1506,663 @@ class Function:
         """Returns a numerical calculation of the integral of
         a function in the domain between a and b.
         Option `option="trapeze"` uses trapeze formula.
+        Options "gauss-kronrod", "romberg" and "tanh-sinh" use
+        the adaptive methods of `integrate` instead of n steps.
         """
+        if option in _INTEGRATION_METHODS:
+            return self.integrate(a, b, method=option).value
         h = (b - a) / n
         if option == "trapeze":
-            res = (self.at(a) - self.at(b)) / 2
-            for i in range(1, n):
-                res += self.at(a + i * h)
+            res = (self.at(a) + self.at(b)) / 2
+            res += sum(self.evaluate([a + i * h for i in range(1, n)]))
         else:
-            res = 0
-            for i in range(n):
-                res += self.at(a + i * h + h / 2)
+            res = sum(self.evaluate([a + i * h + h / 2 for i in range(n)]))
         res *= h
         return res
 
+    def integrate(self,
+                  a: REAL,
+                  b: REAL,
+                  method: str = "gauss-kronrod",
+                  abs_tol: float = 1e-10,
+                  rel_tol: float = 1e-10,
+                  max_evaluations: int = 10000) -> NumericalResult:
+        """Returns the integral between a and b calculated by an adaptive
+        method as NumericalResult with error estimate and amount of
+        evaluations. Methods:
+        "gauss-kronrod"  bisects the interval with the largest error
+        "romberg"        extrapolates trapeze rules (smooth functions)
+        "tanh-sinh"      for functions singular at a or b
+        Stops if the error is smaller than abs_tol or rel_tol times the
+        integral or if max_evaluations would be exceeded.
+        """
+        if method not in _INTEGRATION_METHODS:
+            raise ArgumentError(method, tuple(_INTEGRATION_METHODS))
+        if a == b:
+            return NumericalResult(0, 0)
+        elif a > b:
+            result = self.integrate(b, a, method, abs_tol, rel_tol,
+                                    max_evaluations)
+            result.value = -result.value
+            return result
+        function = _Counter(self._compile())
+        result = _INTEGRATION_METHODS[method](function, a, b, abs_tol,
+                                              rel_tol, max_evaluations)
+        result.evaluations = function.evaluations
+        return result
+
+    def chebfit(self,
+                a: REAL,
+                b: REAL,
+                tolerance: float = 1e-13,
+                max_degree: int = 4096) -> 'Chebyshev':
+        """Returns a Chebyshev series that approximates the function on
+        [a, b]. The function is sampled at Chebyshev points, whose number
+        is doubled until the last coefficients are smaller than tolerance
+        times the largest one. Smaller coefficients are cut off. Raises
+        an ArithmeticError if max_degree is not sufficient.
+        """
+        middle, half = (a + b) / 2, (b - a) / 2
+        n = 16
+        values = self.evaluate([middle + half * cos(pi * j / n)
+                                for j in range(n + 1)])
+        while True:
+            coefficients = _chebyshev_coefficients(values)
+            limit = tolerance * max(map(abs, coefficients))
+            if max(map(abs, coefficients[-max(3, n // 8):])) <= limit:
+                while len(coefficients) > 1 \
+                        and abs(coefficients[-1]) <= limit:
+                    coefficients.pop()
+                return Chebyshev(*coefficients, a=a, b=b)
+            if 2 * n > max_degree:
+                raise ArithmeticError(f"Function is not resolved to "
+                                      f"{tolerance} with degree {n}")
+            # the new points lie between the old ones
+            new_values = self.evaluate([middle + half * cos(pi * j / 2 / n)
+                                        for j in range(1, 2 * n, 2)])
+            values = [e for pair in zip(values, new_values) for e in pair] \
+                + values[-1:]
+            n *= 2
+
     def tangent(self, x: REAL) -> 'Function':
         """Returns a function that lies tangential to self at a given x."""
-        a = self.derivative(x)
-        b = a * -x + self.at(x)
+        y, a = self._jet(x)[:2]
+        b = a * -x + y
         return Function(f"{a} * x + {b}")
 
     def normal(self, x: REAL) -> 'Function':
         """Returns a function that lies normal to self at a given x."""
-        a = -self.derivative(x)
-        b = a * -x + self.at(x)
+        y, slope = self._jet(x)[:2]
+        a = -1 / slope
+        b = a * -x + y
         return Function(f"{a} * x + {b}")
 
 
+def _horner(coefficients: list, z: complex) -> tuple:
+    """Returns p(z) and p'(z) of the polynomial with given coefficients."""
+    p = dp = 0
+    for c in coefficients:
+        dp = dp * z + p
+        p = p * z + c
+    return p, dp
+
+
+def _rounding_error(coefficients: list, z: complex) -> float:
+    """Returns a bound of the rounding error of p(z) calculated with
+    Horner's scheme. Smaller values of |p(z)| are no longer meaningful.
+    """
+    bound, absolute = 0, abs(z)
+    for c in coefficients:
+        bound = bound * absolute + abs(c)
+    return eps * bound
+
+
+def _initial_roots(coefficients: list) -> list:
+    """Returns start values for simultaneous root finding. The values lie
+    on a circle with the geometric mean of the absolutes of the roots as
+    radius. The angles are shifted to break the symmetry of real
+    polynomials.
+    """
+    n = len(coefficients) - 1
+    radius = abs(coefficients[-1] / coefficients[0]) ** (1 / n)
+    return [radius * complex(cos(2 * pi * k / n + 0.4),
+                             sin(2 * pi * k / n + 0.4)) for k in range(n)]
+
+
+def _aberth(coefficients: list, tolerance: float,
+            max_iterations: int) -> NumericalResult:
+    """Aberth-Ehrlich method. Refines all roots of the polynomial at once
+    with cubic convergence. The coefficients must not end with 0.
+    """
+    roots = _initial_roots(coefficients)
+    n = len(roots)
+    done = [False] * n
+    evaluations, error = 0, 0
+    for iteration in range(1, max_iterations + 1):
+        error = 0
+        for k in range(n):
+            if done[k]:
+                continue
+            z = roots[k]
+            p, dp = _horner(coefficients, z)
+            evaluations += 1
+            if p == 0:
+                done[k] = True
+                continue
+            repulsion = sum([1 / (z - roots[j]) for j in range(n)
+                             if j != k and z != roots[j]])
+            ratio = p / dp if dp != 0 else p
+            step = ratio / (1 - ratio * repulsion)
+            roots[k] = z - step
+            error = max(error, abs(step))
+            # further steps cannot improve a root within the rounding error
+            if abs(step) <= tolerance * abs(roots[k]) \
+                    or abs(p) <= _rounding_error(coefficients, z):
+                done[k] = True
+        if all(done):
+            return NumericalResult(roots, error, evaluations, iteration)
+    return NumericalResult(roots, error, evaluations, max_iterations, False)
+
+
+def _durand_kerner(coefficients: list, tolerance: float,
+                   max_iterations: int) -> NumericalResult:
+    """Durand-Kerner (Weierstrass) method. Refines all roots of the
+    polynomial at once. The coefficients must not end with 0.
+    """
+    monic = [c / coefficients[0] for c in coefficients]
+    roots = _initial_roots(monic)
+    n = len(roots)
+    evaluations, error = 0, 0
+    for iteration in range(1, max_iterations + 1):
+        error, converged = 0, True
+        for k in range(n):
+            z = roots[k]
+            denominator = 1
+            for j in range(n):
+                if j != k:
+                    denominator *= z - roots[j]
+            evaluations += 1
+            p = _horner(monic, z)[0]
+            if denominator == 0 or p == 0:
+                continue
+            step = p / denominator
+            roots[k] = z - step
+            error = max(error, abs(step))
+            if abs(step) > tolerance * abs(roots[k]) \
+                    and abs(p) > _rounding_error(monic, z):
+                converged = False
+        if converged:
+            return NumericalResult(roots, error, evaluations, iteration)
+    return NumericalResult(roots, error, evaluations, max_iterations, False)
+
+
+def _polish(coefficients: list, z: complex, steps: int = 3) -> complex:
+    """Refines a root with Newton's method. A step is only taken if it
+    reduces |p(z)|.
+    """
+    p, dp = _horner(coefficients, z)
+    for _ in range(steps):
+        if p == 0 or dp == 0:
+            break
+        candidate = z - p / dp
+        p_candidate, dp_candidate = _horner(coefficients, candidate)
+        if abs(p_candidate) >= abs(p):
+            break
+        z, p, dp = candidate, p_candidate, dp_candidate
+    return z
+
+
+def _taylor(coefficients: list, c: complex, m: int) -> tuple:
+    """Returns the first m Taylor coefficients of the polynomial at c and
+    the same coefficients of the polynomial with absolute coefficients at
+    |c|, which bound their rounding errors. Repeated synthetic division.
+    """
+    values, bounds = list(coefficients), [abs(e) for e in coefficients]
+    taylor, taylor_bounds = [], []
+    for _ in range(m):
+        for column, x in ((values, c), (bounds, abs(c))):
+            for i in range(1, len(column)):
+                column[i] += column[i - 1] * x
+        taylor.append(values.pop())
+        taylor_bounds.append(bounds.pop())
+    return taylor, taylor_bounds
+
+
+def _multiple_root(coefficients: list, group: list) -> complex | None:
+    """Returns the multiple root the group of roots approximates or None.
+    An m-fold root is only found to about eps^(1/m), but it is a simple
+    root of the (m-1)th derivative, on which the mean of the group is
+    refined by Newton's method. The root is accepted if the first m Taylor
+    coefficients at it are within the rounding error.
+    """
+    m = len(group)
+    c = sum(group) / m
+    if all([e.imag == 0 for e in coefficients]) \
+            and abs(c.imag) <= max([abs(z - c) for z in group]):
+        c = complex(c.real)
+    derivative = list(coefficients)
+    for _ in range(m - 1):
+        n = len(derivative) - 1
+        derivative = [e * (n - i) for i, e in enumerate(derivative[:-1])]
+    c = _polish(derivative, c, 10)
+    limit = 2 * eps
+    values, bounds = _taylor(coefficients, c, m)
+    if all([abs(v) <= limit * b for v, b in zip(values, bounds)]):
+        return c
+    return None
+
+
+def _merge_multiple_roots(coefficients: list, roots: list) -> list:
+    """Replaces clusters of roots that approximate a multiple root by the
+    multiple root. An m-fold root is only found to about eps^(1/m), so
+    only m roots within 10 eps^(1/m) times their absolute are grouped.
+    """
+    remaining, merged = list(roots), []
+    while remaining:
+        z = remaining.pop(0)
+        scale = max(1, abs(z))
+        near = sorted([w for w in remaining
+                       if abs(w - z) <= _MAX_CLUSTER_RADIUS * scale],
+                      key=lambda w: abs(w - z))
+        for m in range(len(near) + 1, 1, -1):
+            if abs(near[m - 2] - z) > 10 * eps ** (1 / m) * scale:
+                continue
+            c = _multiple_root(coefficients, [z] + near[:m - 1])
+            if c is not None:
+                for w in near[:m - 1]:
+                    remaining.remove(w)
+                merged += [c] * m
+                break
+        else:
+            merged.append(z)
+    return merged
+
+
+def _real_roots(coefficients: list, roots: list) -> list:
+    """Returns the real roots. Non-real roots of real polynomials come
+    in conjugate pairs, so a root is real if its imaginary part is within
+    the rounding error or if no other root lies closer to its conjugate
+    than to the real axis.
+    """
+    real = all([complex(e).imag == 0 for e in coefficients])
+    roots = [complex(e) for e in roots]
+    real_roots, paired = [], set()
+    for k, z in enumerate(roots):
+        if abs(z.imag) <= 1e-9 * max(1, abs(z)):
+            real_roots.append(z.real)
+        elif real and k not in paired:
+            partners = [j for j, w in enumerate(roots) if j != k
+                        and j not in paired
+                        and abs(w - z.conjugate()) < abs(z.imag)]
+            if partners:
+                paired.update((k, partners[0]))
+            else:
+                real_roots.append(z.real)
+    return real_roots
+
+
+def _companion(coefficients: list, tolerance: float,
+               max_iterations: int) -> NumericalResult:
+    """Eigenvalues of the balanced companion matrix by the shifted QR
+    algorithm. Backward stable, also for ill-conditioned polynomials.
+    The coefficients must not end with 0.
+    """
+    from .algebra import _balance, _hessenberg_qr
+    n = len(coefficients) - 1
+    rows = [[0j] * n for _ in range(n)]
+    for j in range(n):
+        rows[0][j] = -coefficients[j + 1] / coefficients[0]
+    for i in range(1, n):
+        rows[i][i - 1] = 1
+    roots, error, iterations, converged = _hessenberg_qr(
+        _balance(rows), max(tolerance, eps), max_iterations
+    )
+    return NumericalResult(roots, error, 0, iterations, converged)
+
+
+_MAX_CLUSTER_RADIUS = 2e-2
+
+_POLYNOMIAL_ROOT_METHODS = {"aberth": _aberth,
+                            "durand-kerner": _durand_kerner,
+                            "companion": _companion}
+
+
+_KARATSUBA_THRESHOLD = 32
+_FFT_THRESHOLD = 512
+
+
+def _schoolbook(a: list, b: list) -> list:
+    """Convolution of two coefficient lists by the schoolbook method."""
+    result = [0] * (len(a) + len(b) - 1)
+    for i, e in enumerate(a):
+        if e == 0:
+            continue
+        for j, f in enumerate(b):
+            result[i + j] += e * f
+    return result
+
+
+def _karatsuba(a: list, b: list) -> list:
+    """Convolution of two coefficient lists by Karatsuba's method. Uses
+    three instead of four half-size products and works for any ring,
+    including Fraction.
+    """
+    if min(len(a), len(b)) <= _KARATSUBA_THRESHOLD:
+        return _schoolbook(a, b)
+    if len(a) < len(b):
+        a, b = b, a
+    m = len(a) // 2
+    result = [0] * (len(a) + len(b) - 1)
+    if len(b) <= m:
+        for offset, part in ((0, a[:m]), (m, a[m:])):
+            for i, e in enumerate(_karatsuba(part, b)):
+                result[i + offset] += e
+        return result
+    a_low, a_high, b_low, b_high = a[:m], a[m:], b[:m], b[m:]
+    low = _karatsuba(a_low, b_low)
+    high = _karatsuba(a_high, b_high)
+    middle = _karatsuba(_add(a_low, a_high), _add(b_low, b_high))
+    for i, e in enumerate(low):
+        result[i] += e
+        result[i + m] -= e
+    for i, e in enumerate(high):
+        result[i + 2 * m] += e
+        result[i + m] -= e
+    for i, e in enumerate(middle[:len(result) - m]):
+        result[i + m] += e
+    return result
+
+
+def _add(a: list, b: list) -> list:
+    """Adds coefficient lists that are aligned at their first element."""
+    if len(a) < len(b):
+        a, b = b, a
+    return [e + b[i] for i, e in enumerate(a[:len(b)])] + list(a[len(b):])
+
+
+def _fft(values: list, inverse: bool = False) -> list:
+    """Iterative radix-2 fast Fourier transform. The length of values
+    must be a power of 2.
+    """
+    n = len(values)
+    values = list(values)
+    j = 0
+    for i in range(1, n):
+        bit = n >> 1
+        while j & bit:
+            j ^= bit
+            bit >>= 1
+        j |= bit
+        if i < j:
+            values[i], values[j] = values[j], values[i]
+    sign = 1 if inverse else -1
+    twiddles = [_e ** (sign * 2j * pi * k / n) for k in range(n // 2)]
+    size = 2
+    while size <= n:
+        half, stride = size // 2, n // size
+        for start in range(0, n, size):
+            for k in range(half):
+                u = values[start + k]
+                v = values[start + k + half] * twiddles[k * stride]
+                values[start + k] = u + v
+                values[start + k + half] = u - v
+        size *= 2
+    if inverse:
+        return [z / n for z in values]
+    return values
+
+
+def _fft_product(a: list, b: list) -> list:
+    """Convolution of two float or complex coefficient lists with the
+    fast Fourier transform. The rounding errors are relative to the
+    largest coefficients.
+    """
+    length = len(a) + len(b) - 1
+    n = 1
+    while n < length:
+        n *= 2
+    transformed = zip(_fft(list(a) + [0] * (n - len(a))),
+                      _fft(list(b) + [0] * (n - len(b))))
+    result = _fft([u * v for u, v in transformed], inverse=True)[:length]
+    if any([type(e) == complex for e in a + b]):
+        return result
+    return [z.real for z in result]
+
+
+def _integral(coefficients: list) -> tuple:
+    """Multiplies integer and fraction coefficients by the least common
+    multiple of the denominators. Returns the integer coefficients and
+    the multiple.
+    """
+    denominator = 1
+    for e in coefficients:
+        if type(e) == Fraction:
+            denominator = lcm(denominator, e.b)
+    return [e.a * (denominator // e.b) if type(e) == Fraction
+            else e * denominator for e in coefficients], denominator
+
+
+def _kronecker(a: list, b: list) -> list:
+    """Exact convolution of two integer coefficient lists by Kronecker
+    substitution. The coefficients are packed as bytes into one integer
+    each, which are multiplied by the fast integer multiplication of
+    Python.
+    """
+    bound = min(len(a), len(b)) * max(map(abs, a)) * max(map(abs, b))
+    size = bound.bit_length() // 8 + 1
+    length = len(a) + len(b) - 1
+
+    def pack(coefficients):
+        positive = [max(e, 0).to_bytes(size, "big") for e in coefficients]
+        negative = [max(-e, 0).to_bytes(size, "big") for e in coefficients]
+        return int.from_bytes(b"".join(positive), "big") \
+            - int.from_bytes(b"".join(negative), "big")
+
+    # every digit is biased by half of its range to make it positive
+    bias = int.from_bytes((b"\x80" + bytes(size - 1)) * length, "big")
+    product = (pack(a) * pack(b) + bias).to_bytes(size * length, "big")
+    half = 1 << (8 * size - 1)
+    return [int.from_bytes(product[k * size:(k + 1) * size], "big") - half
+            for k in range(length)]
+
+
+def _multiply(a: list, b: list) -> list:
+    """Convolution of two coefficient lists. Chooses the engine by the
+    types and lengths: Kronecker substitution for integers and fractions,
+    which stay exact, the fast Fourier transform for long float lists,
+    Karatsuba's method otherwise.
+    """
+    if min(len(a), len(b)) <= _KARATSUBA_THRESHOLD:
+        return _schoolbook(a, b)
+    types = set(map(type, a + b))
+    if types <= {int, Fraction}:
+        if types == {int}:
+            return _kronecker(a, b)
+        (a, a_denominator), (b, b_denominator) = _integral(a), _integral(b)
+        return [Fraction(e, a_denominator * b_denominator).reduce()
+                for e in _kronecker(a, b)]
+    if types <= {int, float, complex} \
+            and min(len(a), len(b)) >= _FFT_THRESHOLD:
+        return _fft_product(a, b)
+    return _karatsuba(a, b)
+
+
+def _exact(coefficients: list) -> bool:
+    """Whether all coefficients are integers or fractions."""
+    return all([type(e) in (int, Fraction) for e in coefficients])
+
+
+def _divide(x, y):
+    """Divides coefficients. Integers and fractions are divided exactly,
+    integers stay integers if y divides x.
+    """
+    if type(x) == int and type(y) == int and x % y == 0:
+        return x // y
+    if type(x) in (int, Fraction) and type(y) in (int, Fraction):
+        return Fraction(x, y).reduce()
+    return x / y
+
+
+def _strip(coefficients: list) -> list:
+    """Removes leading zeros. Keeps one coefficient of the zero
+    polynomial.
+    """
+    i = 0
+    while i < len(coefficients) - 1 and coefficients[i] == 0:
+        i += 1
+    return coefficients[i:]
+
+
+def _long_division(a: list, b: list) -> tuple:
+    """Divides the coefficient list a by b with remainder. Returns
+    quotient and remainder as coefficient lists.
+    """
+    if len(a) < len(b):
+        return [0], a
+    remainder = list(a)
+    quotient = []
+    for i in range(len(a) - len(b) + 1):
+        factor = _divide(remainder[i], b[0])
+        quotient.append(factor)
+        if factor != 0:
+            for j in range(1, len(b)):
+                remainder[i + j] -= factor * b[j]
+    return quotient, _strip(remainder[len(a) - len(b) + 1:] or [0])
+
+
+def _divided_differences(xs: list, ys: list) -> list:
+    """Returns the coefficients of the Newton form of the interpolation
+    polynomial through the points (xs[i], ys[i]).
+    """
+    coefficients = list(ys)
+    for k in range(1, len(xs)):
+        for i in range(len(xs) - 1, k - 1, -1):
+            difference = xs[i] - xs[i - k]
+            if difference == 0:
+                raise ArithmeticError("Points with same x coordinate "
+                                      "cannot be processed")
+            coefficients[i] = _divide(coefficients[i] - coefficients[i - 1],
+                                      difference)
+    return coefficients
+
+
+def _interpolate(xs: list, ys: list) -> list:
+    """Interpolation with Newton's divided differences in O(n^2). Returns
+    the coefficient list of the interpolation polynomial.
+    """
+    newton = _divided_differences(xs, ys)
+    result = [newton[-1]]
+    for k in range(len(xs) - 2, -1, -1):
+        # result * (x - xs[k]) + newton[k]
+        result = [result[0]] \
+            + [result[i] - xs[k] * result[i - 1]
+               for i in range(1, len(result))] \
+            + [newton[k] - xs[k] * result[-1]]
+    return result
+
+
+def _primitive(coefficients: list) -> list:
+    """Divides integer coefficients by their greatest common divisor and
+    makes the leading coefficient positive.
+    """
+    content = 0
+    for e in coefficients:
+        content = gcd(content, e) if content else abs(e)
+    content *= sgn(coefficients[0])
+    return [e // content for e in coefficients] if content else coefficients
+
+
+def _pseudo_remainder(a: list, b: list) -> list:
+    """Remainder of lc(b)^(deg a - deg b + 1) * a divided by b. Stays in
+    the integers.
+    """
+    remainder = list(a)
+    for _ in range(len(a) - len(b) + 1):
+        factor = remainder[0]
+        remainder = [b[0] * e - factor * (b[i] if i < len(b) else 0)
+                     for i, e in enumerate(remainder)][1:]
+    return _strip(remainder or [0])
+
+
+def _subresultant_gcd(a: list, b: list) -> list:
+    """Greatest common divisor of two integer coefficient lists with the
+    subresultant remainder sequence, which keeps the coefficients small
+    without calculating their content at every step. The result is
+    primitive with positive leading coefficient.
+    """
+    if len(a) < len(b):
+        a, b = b, a
+    a, b = _primitive(a), _primitive(b)
+    g = h = 1
+    while True:
+        delta = len(a) - len(b)
+        remainder = _pseudo_remainder(a, b)
+        if remainder == [0]:
+            return _primitive(b)
+        if len(remainder) == 1:
+            return [1]
+        a, b = b, [e // (g * h ** delta) for e in remainder]
+        g = a[0]
+        h = g ** delta // h ** (delta - 1) if delta else h
+
+
+def _euclidean_gcd(a: list, b: list, tolerance: float) -> list:
+    """Greatest common divisor of two float or complex coefficient lists
+    with Euclid's algorithm. Remainders are zero if all coefficients are
+    smaller than tolerance times the largest coefficient of the divisor.
+    The result is monic.
+    """
+    if len(a) < len(b):
+        a, b = b, a
+    while True:
+        remainder = _long_division(a, b)[1]
+        scale = max(map(abs, b))
+        while remainder and abs(remainder[0]) <= tolerance * scale:
+            remainder = remainder[1:]
+        if not remainder:
+            return [e / b[0] for e in b]
+        a, b = b, remainder
+
+
 class Polynomial:
     """A real function a_0 x^n + a_1 x^{n-1} + ... + a_{n-1} x + a_n
-    with real n.
+    with real n. The coefficients are stored in an immutable tuple, which
+    is shared instead of copied.
     """
 
+    __slots__ = ("_value",)
+
     def __init__(self, *args):
         """Insert arguments in analytical order:
         args[0] x^n + args[1] x^{n-1} + ...
+        or points to get the interpolation polynomial of lowest degree
+        through them.
         """
         if type(args[0]) in (int, float, complex, Fraction):
-            self._value = []
-            i = 0
-            while args[i] == 0:
-                i += 1
-            self._value = list(args[i:])
+            self._value = tuple(_strip(args))
         elif type(args[0]) == Point:
-            arg_list = [[] for _ in range(len(args))]
-            for i, e in enumerate(args):
-                for j in range(len(args)):
-                    if e[0] == arg_list[i-1][0]:
-                        raise ArithmeticError("Points with same x coordinate"
-                                              "cannot be processed")
-                    arg_list[i].append(e[0] ** (len(args)-j-1))
-                arg_list[i].append(e[-1])
-            from .algebra import SLE
-            self._value = list(SLE(*tuple(arg_list)).solve())
+            self._value = tuple(_strip(_interpolate([e[0] for e in args],
+                                                    [e[-1] for e in args])))
         else:
             raise ArgumentError(type(args[0]), "int, float, complex, Fraction")
 
+    @classmethod
+    def _from_list(cls, value: list | tuple) -> 'Polynomial':
+        """Creates a polynomial from coefficients without leading zeros
+        without checking them. Used for the results of internal arithmetic.
+        """
+        obj = object.__new__(cls)
+        obj._value = tuple(value)
+        return obj
+
     def __iter__(self):
         """Yields an iterator of the polynomial coefficients."""
         for e in self._value:
             yield e
 
     def __getitem__(self, item):
-        """Allows item access for coefficients."""
-        return copy.deepcopy(self._value[item])
+        """Allows item access for coefficients. Slices are tuples."""
+        return self._value[item]
 
     def __repr__(self):
         """Gives string return in form
@@ -323,7 +2181,7 @@ class Polynomial:
 
     def __neg__(self):
         """Returns negative polynomial. All coefficient signs are switched."""
-        return Polynomial(*tuple([-e for e in self]))
+        return Polynomial._from_list([-e for e in self._value])
 
     def __len__(self):
         """Returns the amount of coefficients. Corresponds to degree + 1"""
@@ -359,15 +2217,14 @@ class Polynomial:
         return -self + other
 
     def __mul__(self, other):
-        """Multiplies two polynomials or a polynomial with a REAL."""
+        """Multiplies two polynomials or a polynomial with a REAL. Long
+        polynomials are multiplied with Karatsuba's method, the fast Fourier
+        transform or, for integers and fractions, exact Kronecker
+        substitution.
+        """
         arg_list = []
         if type(other) == Polynomial:
-            arg_list = [0 for _ in range(self.degree() + other.degree() + 1)]
-            for i, e_self in enumerate(self):
-                power_self = self.degree() - i
-                for j, e_other in enumerate(other):
-                    power_other = other.degree() - j
-                    arg_list[-power_self-power_other-1] += e_self * e_other
+            arg_list = _multiply(self._value, other._value)
         elif type(other) in (float, int, Fraction):
             arg_list = [other * e for e in self] if other != 0 else [0]
         return Polynomial(*tuple(arg_list))
@@ -377,13 +2234,52 @@ class Polynomial:
     def __truediv__(self, other: REAL) -> 'Polynomial':
         return Polynomial(*tuple([Fraction(e, other) for e in self]))
 
+    def __divmod__(self, other: 'Polynomial' | REAL) -> tuple:
+        """Polynomial long division. Returns quotient q and remainder r
+        with self = q * other + r and r.degree() < other.degree().
+        Integer and fraction coefficients are divided exactly.
+        """
+        if type(other) in (int, float, complex, Fraction):
+            other = Polynomial(other)
+        elif type(other) != Polynomial:
+            raise ArgumentError(type(other), "polynomial or real number")
+        if other._value == (0,):
+            raise ZeroDivisionError("Division by the zero polynomial")
+        quotient, remainder = _long_division(self._value, other._value)
+        return Polynomial(*tuple(quotient)), Polynomial(*tuple(remainder))
+
+    def __floordiv__(self, other: 'Polynomial' | REAL) -> 'Polynomial':
+        """Quotient of the polynomial long division."""
+        return divmod(self, other)[0]
+
+    def __mod__(self, other: 'Polynomial' | REAL) -> 'Polynomial':
+        """Remainder of the polynomial long division."""
+        return divmod(self, other)[1]
+
     def at(self, x):
-        """Returns y value to given x."""
+        """Returns y value to given x. Uses Horner's scheme."""
         res = 0
-        for i, e in enumerate(self):
-            res += e * x**(self.degree() - i)
+        for e in self._value:
+            res = res * x + e
         return res
 
+    def evaluate(self, values: list | tuple | array) -> list | array:
+        """Returns the y values for a sequence of x values. Every value is
+        calculated with Horner's scheme. Returns an array if an array is
+        given.
+        """
+        coefficients = self._value
+
+        def horner(x):
+            res = 0
+            for e in coefficients:
+                res = res * x + e
+            return res
+
+        if type(values) == array:
+            return array("d", map(horner, values))
+        return list(map(horner, values))
+
     def no_fractions(self):
         """All coefficients are made to floats."""
         return Polynomial(*tuple([float(e) for e in self]))
@@ -409,30 +2305,78 @@ class Polynomial:
             raise ArithmeticError("No root found")
 
     def even_powers(self):
-        for index, e in enumerate(reversed(list(self))):
+        for index, e in enumerate(reversed(self._value)):
             if not is_even(index) and e != 0:
                 return False
         return True
 
     def odd_powers(self):
-        for index, e in enumerate(reversed(list(self))):
+        for index, e in enumerate(reversed(self._value)):
             if is_even(index) and e != 0:
                 return False
         return True
 
-    def decomposition(self):
-        ret_list = [copy.deepcopy(self)]
-        while True:
-            new_ret_list = []
-            for e in ret_list:
-                if len(e) <= 2:
-                    continue
-                if e[-1] == 0:
-                    new_ret_list += [Polynomial(1, 0),
-                                     Polynomial(*tuple(e[:-1]))]
-                    continue
-                elif e.even_powers():
-                    pass
+    def gcd(self,
+            other: 'Polynomial',
+            tolerance: float = 1e-9) -> 'Polynomial':
+        """Returns the greatest common divisor of two polynomials. Integer
+        and fraction coefficients are processed exactly with the
+        subresultant remainder sequence, the result has coprime integer
+        coefficients and a positive leading coefficient. Other
+        coefficients use Euclid's algorithm, where remainders smaller than
+        tolerance are zero, and return a monic polynomial.
+        """
+        if type(other) != Polynomial:
+            raise ArgumentError(type(other), "polynomial")
+        a, b = list(self._value), list(other._value)
+        if a == [0]:
+            a, b = b, a
+        if a == [0]:
+            raise ArithmeticError("The gcd of two zero polynomials is not "
+                                  "defined")
+        if _exact(a + b):
+            a, b = _integral(a)[0], _integral(b)[0]
+            if b == [0]:
+                return Polynomial(*tuple(_primitive(a)))
+            return Polynomial(*tuple(_subresultant_gcd(a, b)))
+        if b == [0]:
+            return Polynomial(*tuple([e / a[0] for e in a]))
+        return Polynomial(*tuple(_euclidean_gcd(a, b, tolerance)))
+
+    def square_free(self) -> list:
+        """Square-free factorization by Yun's algorithm. Returns a list of
+        (factor, multiplicity) tuples. The factors have no multiple roots
+        and no common roots, self is a constant times the product of the
+        factors to the power of their multiplicities.
+        """
+        if self.degree() < 1:
+            return []
+        derivative = self.derivative()
+        divisor = self.gcd(derivative)
+        w = self // divisor
+        z = derivative // divisor - w.derivative()
+        factors = []
+        multiplicity = 1
+        while w.degree() > 0:
+            factor = w.gcd(z)
+            w = w // factor
+            z = z // factor - w.derivative()
+            if factor.degree() > 0:
+                factors.append((factor, multiplicity))
+            multiplicity += 1
+        return factors
+
+    def decomposition(self) -> list:
+        """Returns the factors of the square-free factorization, each
+        repeated by its multiplicity, after a constant polynomial. The
+        product of the list is self.
+        """
+        factors = [factor for factor, multiplicity in self.square_free()
+                   for _ in range(multiplicity)]
+        product = Polynomial(1)
+        for factor in factors:
+            product = product * factor
+        return [self // product] + factors
 
     def horner(self, x_0: int | float = 0):
         """Returns a polynomial with executed Horner's scheme with given
@@ -445,80 +2389,118 @@ class Polynomial:
             product = x_0 * (e + product)
         return Polynomial(*tuple(arg_list))
 
-    def roots(self, mode=complex):
+    def solve(self,
+              method: str = "aberth",
+              tolerance: float = 1e-14,
+              max_iterations: int = 500,
+              polish: bool = True) -> NumericalResult:
+        """Finds all complex roots at once. Methods:
+        "aberth"         Aberth-Ehrlich method (cubic convergence)
+        "durand-kerner"  Weierstrass iteration (quadratic convergence)
+        "companion"      shifted QR algorithm on the companion matrix
+        The iterations stop if all steps are smaller than tolerance times
+        the root. The QR algorithm splits off a root as soon as its
+        subdiagonal element is smaller than tolerance.
+        With polish=True every root is refined by Newton's method on the
+        polynomial, and clusters of roots that approximate a multiple root
+        are replaced by the multiple root. Returns a NumericalResult with
+        the list of roots.
+        """
+        if method not in _POLYNOMIAL_ROOT_METHODS:
+            raise ArgumentError(method, tuple(_POLYNOMIAL_ROOT_METHODS))
+        coefficients = [complex(e) for e in self]
+        zeros = 0
+        while len(coefficients) > 1 and coefficients[-1] == 0:
+            coefficients.pop()
+            zeros += 1
+        if len(coefficients) == 1:
+            result = NumericalResult([], 0)
+        elif len(coefficients) == 2:
+            result = NumericalResult([-coefficients[1] / coefficients[0]], 0)
+        else:
+            result = _POLYNOMIAL_ROOT_METHODS[method](
+                coefficients, tolerance, max_iterations
+            )
+        if polish:
+            result.value = _merge_multiple_roots(
+                coefficients, [_polish(coefficients, z) for z in result.value]
+            )
+        result.value = sorted(result.value + [0j] * zeros,
+                              key=lambda z: (z.real, z.imag))
+        return result
+
+    def roots(self, mode=complex, method: str = "aberth"):
         """Returns a list of the roots of a polynomial.
         `mode=float` or `mode="real"` returns real solutions only.
+        `method` is the method of `solve`, e.g. "companion" for
+        ill-conditioned polynomials.
         """
         if self.degree() == 0:
             if self[0] != 0:
                 return []
             else:
-                return ArithmeticError("Null function has an infinite amount"
-                                       "of roots")
+                raise ArithmeticError("Null function has an infinite amount"
+                                      "of roots")
         elif self.degree() == 1:
             ret_list = [Fraction(-self[1], self[0])]
-        elif self.degree() == 2:
-            ret_list = [
-                (-self[1]-(self[1]**2-4*self[0]*self[2])**.5)/(2*self[0]),
-                (-self[1]+(self[1]**2-4*self[0]*self[2])**.5)/(2*self[0])
-            ]
-        elif self.degree() > 2 and self.even_powers():
-            first_one = self / self[0]
-            substitute = []
-            for e in first_one:
-                if e != 0:
-                    substitute.append(e)
+        elif _exact(self._value):
+            # multiple roots are found once in their square-free factor
             ret_list = []
-            for e in Polynomial(*tuple(substitute)).roots():
-                ret_list.append(e**0.5)
-                ret_list.append(-e**0.5)
+            for factor, multiplicity in self.square_free():
+                if factor.degree() == 1:
+                    roots = [Fraction(-factor[1], factor[0])]
+                else:
+                    roots = factor.solve(method).value
+                ret_list += roots * multiplicity
+            ret_list.sort(key=lambda z: (complex(z).real, complex(z).imag))
         else:
-            ret_list = sorted(
-                        [self.newton_method(1+1j)]
-                        + self.horner(self.newton_method(1+1j)).roots(),
-                        key=lambda ele: ele.real
-                )
+            ret_list = self.solve(method).value
         if mode == complex:
             return ret_list
         elif mode == float or mode == "real":
-            real_solutions = []
-            for e in ret_list:
-                if e.imag == 0:
-                    real_solutions.append(e.real)
-            return real_solutions
+            return _real_roots(self._value, ret_list)
 
-    def max(self):
+    def max(self) -> PointArray:
         """Returns the maxima of the polynomial based on the real roots."""
-        x_values = self.derivative().roots(mode=float)
-        ret_list = []
-        for e in x_values:
-            if self.derivative(e, grade=2) < 0:
-                ret_list.append(Point(e, self.at(e)))
-        return ret_list
-
-    def min(self):
+        x_values = [e for e in self.derivative().roots(mode=float)
+                    if self.derivative(e, grade=2) < 0]
+        return PointArray.from_coordinates(
+            x_values, self.evaluate(x_values)).unique()
+
+    def min(self) -> PointArray:
         """Returns the minima of a function based on the real roots."""
-        return [e.negative_y() for e in (-self).max()]
+        x_values, y_values = (-self).max().coordinates()
+        return PointArray.from_coordinates(x_values, [-e for e in y_values])
 
-    def intersection(self, other, mode=complex):
-        return [Point(e, self.at(e)) for e in (self - other).roots(mode=mode)]
+    def intersection(self, other, mode=complex) -> PointArray:
+        """Returns the intersections with another polynomial. Multiple
+        roots of the difference appear once.
+        """
+        x_values = (self - other).roots(mode=mode)
+        return PointArray.from_coordinates(
+            x_values, self.evaluate(x_values)).unique()
 
     def derivative(self,
                    x: float | int = None,
                    grade: int = 1) -> REAL | 'Polynomial':
         """Returns the derivative polynom if no x is specified. Else returns
-        the value of the derivative at given x.
+        the value of the derivative at given x. The first and second
+        derivative at x are calculated with dual numbers.
         """
-        function = copy.deepcopy(self)
+        if x is not None and grade in (1, 2):
+            result = self.at(Dual(x, 1))
+            if type(result) != Dual:
+                return 0
+            return result.first if grade == 1 else result.second
+        coefficients = self._value
         for _ in range(grade):
-            arg_list = []
-            if len(function) == 1:
-                arg_list = [0]
-            for i, e in enumerate(function[:-1]):
-                arg_list.append(e * (function.degree() - i))
-            function = Polynomial(*tuple(arg_list))
-            if list(function) == [0]:
+            degree = len(coefficients) - 1
+            if degree == 0:
+                coefficients = (0,)
                 break
+            coefficients = [e * (degree - i)
+                            for i, e in enumerate(coefficients[:-1])]
+        function = Polynomial._from_list(coefficients)
         if x is not None:
             return function.at(x)
         else:
@@ -546,15 +2528,400 @@ class Polynomial:
                  grade: int = 1) -> REAL | 'Polynomial':
         """Returns the integral polynom if no a and b specified. Else returns
         the integral between a and b."""
-        function = copy.deepcopy(self)
+        coefficients = self._value
+        if coefficients != (0,):
+            for _ in range(grade):
+                degree = len(coefficients) - 1
+                coefficients = [_divide(e, degree - i + 1)
+                                for i, e in enumerate(coefficients)] + [0]
+        function = Polynomial._from_list(coefficients)
+        if a is None and b is None:
+            return function
+        return function.at(b) - function.at(a)
+
+
+def _chebyshev_coefficients(values: list) -> list:
+    """Returns the coefficients of the Chebyshev series that interpolates
+    the values at the n + 1 Chebyshev points cos(pi * j / n). n must be a
+    power of 2. Uses the fast Fourier transform of the even extension.
+    """
+    n = len(values) - 1
+    transformed = _fft(values + values[-2:0:-1])
+    coefficients = [z.real / n for z in transformed[:n + 1]]
+    coefficients[0] /= 2
+    coefficients[-1] /= 2
+    return coefficients
+
+
+class _OrthogonalSeries(ABC):
+    """Series c_0 p_0(t) + c_1 p_1(t) + ... + c_n p_n(t) of orthogonal
+    polynomials. The interval [a, b] of x is mapped to t in [-1, 1].
+    """
+
+    __slots__ = ("_value", "a", "b")
+
+    def __init__(self, *args: REAL, a: REAL = -1, b: REAL = 1):
+        """Insert the coefficients in ascending order:
+        args[0] p_0 + args[1] p_1 + ...
+        """
+        if not args:
+            raise ArgumentError(args, "at least one coefficient")
+        if not a < b:
+            raise ArgumentError((a, b), "interval with a < b")
+        self._value = tuple(args)
+        self.a, self.b = a, b
+
+    def __iter__(self):
+        """Yields the coefficients in ascending order."""
+        for e in self._value:
+            yield e
+
+    def __getitem__(self, item):
+        """Allows item access for coefficients."""
+        return self._value[item]
+
+    def __len__(self):
+        """Returns the amount of coefficients. Corresponds to degree + 1"""
+        return len(self._value)
+
+    def __repr__(self):
+        coefficients = ", ".join([str(e) for e in self._value])
+        return f"{type(self).__name__}({coefficients}, " \
+               f"a={self.a}, b={self.b})"
+
+    def degree(self):
+        """Returns the degree of the series."""
+        return len(self) - 1
+
+    def _t(self, x):
+        """Maps x from [a, b] to [-1, 1]. Exact for exact values."""
+        if _exact(self._value + (x, self.a, self.b)):
+            return _divide(2 * x - self.a - self.b, self.b - self.a)
+        return (2 * x - self.a - self.b) / (self.b - self.a)
+
+    def at(self, x):
+        """Returns the value at x. Uses Clenshaw's recurrence."""
+        return self._clenshaw(self._t(x))
+
+    def evaluate(self, values: list | tuple | array) -> list | array:
+        """Returns the values for a sequence of x values. Returns an array
+        if an array is given.
+        """
+        factors = self._factors(truediv)
+
+        def clenshaw(x):
+            return self._clenshaw(self._t(x), factors)
+
+        if type(values) == array:
+            return array("d", map(clenshaw, values))
+        return list(map(clenshaw, values))
+
+    def to_polynomial(self) -> 'Polynomial':
+        """Returns the series in monomial form."""
+        t = Polynomial(_divide(2, self.b - self.a),
+                       _divide(-self.a - self.b, self.b - self.a))
+        result = self._clenshaw(t)
+        return result if type(result) == Polynomial else Polynomial(result)
+
+    @classmethod
+    def from_polynomial(cls, polynomial: 'Polynomial',
+                        a: REAL = -1, b: REAL = 1):
+        """Returns the series of a polynomial on the interval [a, b]."""
+        half, middle = _divide(b - a, 2), _divide(a + b, 2)
+        series = [0]
+        # Horner's scheme with x = half * t + middle
+        for e in polynomial:
+            series = [half * u + middle * v
+                      for u, v in zip(cls._times_t(series), series + [0])]
+            series[0] += e
+        while len(series) > 1 and series[-1] == 0:
+            series.pop()
+        return cls(*series, a=a, b=b)
+
+    def _factors(self, divide) -> list:
+        """Returns the factors a_k / d_k and b_{k+1} / d_{k+1} of
+        Clenshaw's recurrence for k = 0, ..., n.
+        """
+        recurrence = self._recurrence
+        factors = []
+        a_k, _, d_k = recurrence(0)
+        for k in range(len(self)):
+            a_next, b_next, d_next = recurrence(k + 1)
+            factors.append((divide(a_k, d_k), divide(b_next, d_next)))
+            a_k, d_k = a_next, d_next
+        return factors
+
+    def _clenshaw(self, t, factors: list = None):
+        """Clenshaw's recurrence for
+        d_k p_{k+1} = a_k t p_k - b_k p_{k-1}.
+        Factors for inexact arguments can be given to reuse them.
+        """
+        exact = type(t) in (int, Fraction, Polynomial)
+        if exact or factors is None:
+            # exact recurrence factors for exact arguments
+            factors = self._factors(_divide if exact else truediv)
+        b1 = b2 = 0
+        for k in range(len(self) - 1, -1, -1):
+            alpha, beta = factors[k]
+            b1, b2 = alpha * t * b1 - beta * b2 + self._value[k], b1
+        return b1
+
+    @classmethod
+    def _times_t(cls, coefficients: list) -> list:
+        """Multiplies a series with t:
+        t p_k = (d_k p_{k+1} + b_k p_{k-1}) / a_k.
+        """
+        result = [0] * (len(coefficients) + 1)
+        for k, c in enumerate(coefficients):
+            a_k, b_k, d_k = cls._recurrence(k)
+            result[k + 1] += _divide(d_k * c, a_k)
+            if k > 0:
+                result[k - 1] += _divide(b_k * c, a_k)
+        return result
+
+    @staticmethod
+    @abstractmethod
+    def _recurrence(k: int) -> tuple:
+        """Returns the integers a_k, b_k and d_k of the three-term
+        recurrence d_k p_{k+1} = a_k t p_k - b_k p_{k-1}.
+        """
+
+
+class Chebyshev(_OrthogonalSeries):
+    """Chebyshev series c_0 T_0(t) + c_1 T_1(t) + ... on the interval
+    [a, b]. Numerically stable at high degrees, where the monomial form
+    is not.
+    """
+
+    __slots__ = ()
+
+    @staticmethod
+    def _recurrence(k: int) -> tuple:
+        """T_1 = t T_0 and T_{k+1} = 2t T_k - T_{k-1}."""
+        return (2 if k else 1), 1, 1
+
+
+class Legendre(_OrthogonalSeries):
+    """Legendre series c_0 P_0(t) + c_1 P_1(t) + ... on the interval
+    [a, b].
+    """
+
+    __slots__ = ()
+
+    @staticmethod
+    def _recurrence(k: int) -> tuple:
+        """(k + 1) P_{k+1} = (2k + 1) t P_k - k P_{k-1}."""
+        return 2 * k + 1, k, k + 1
+
+
+def _tridiagonal(lower: list, diagonal: list, upper: list,
+                 right: list) -> list:
+    """Solves a tridiagonal linear system with the Thomas algorithm in
+    O(n). lower[0] and upper[-1] are not used.
+    """
+    n = len(diagonal)
+    upper, right = list(upper), list(right)
+    upper[0] /= diagonal[0]
+    right[0] /= diagonal[0]
+    for i in range(1, n):
+        pivot = diagonal[i] - lower[i] * upper[i - 1]
+        if i < n - 1:
+            upper[i] /= pivot
+        right[i] = (right[i] - lower[i] * right[i - 1]) / pivot
+    for i in range(n - 2, -1, -1):
+        right[i] -= upper[i] * right[i + 1]
+    return right
+
+
+def _spline_moments(x: list, y: list, boundary: str, slopes: tuple) -> list:
+    """Returns the second derivatives of the cubic spline at the knots."""
+    n = len(x) - 1
+    h = [x[i + 1] - x[i] for i in range(n)]
+    slope = [(y[i + 1] - y[i]) / h[i] for i in range(n)]
+    if n == 1 or (n == 2 and boundary == "not-a-knot"):
+        if boundary == "clamped":
+            lower, diagonal, upper = [0, h[0]], [2 * h[0], 2 * h[0]], [h[0], 0]
+            right = [6 * (slope[0] - slopes[0]), 6 * (slopes[1] - slope[0])]
+            return _tridiagonal(lower, diagonal, upper, right)
+        # a line or the parabola through three points
+        curvature = (slope[-1] - slope[0]) / (x[-1] - x[0]) * 2
+        return [curvature] * (n + 1)
+    lower = [0] + [h[i - 1] for i in range(1, n)] + [0]
+    diagonal = [1] + [2 * (h[i - 1] + h[i]) for i in range(1, n)] + [1]
+    upper = [0] + [h[i] for i in range(1, n)] + [0]
+    right = [0] + [6 * (slope[i] - slope[i - 1]) for i in range(1, n)] + [0]
+    if boundary == "clamped":
+        diagonal[0], upper[0] = 2 * h[0], h[0]
+        right[0] = 6 * (slope[0] - slopes[0])
+        lower[n], diagonal[n] = h[n - 1], 2 * h[n - 1]
+        right[n] = 6 * (slopes[1] - slope[n - 1])
+    elif boundary == "not-a-knot":
+        # the first and last moments are eliminated with the continuity
+        # of the third derivative at x[1] and x[n - 1]
+        diagonal[1] = (h[0] + h[1]) * (h[0] + 2 * h[1]) / h[1]
+        upper[1] = (h[1] ** 2 - h[0] ** 2) / h[1]
+        lower[n - 1] = (h[n - 2] ** 2 - h[n - 1] ** 2) / h[n - 2]
+        diagonal[n - 1] = (h[n - 2] + h[n - 1]) \
+            * (2 * h[n - 2] + h[n - 1]) / h[n - 2]
+        moments = _tridiagonal(lower[1:n], diagonal[1:n], upper[1:n],
+                               right[1:n])
+        first = ((h[0] + h[1]) * moments[0] - h[0] * moments[1]) / h[1]
+        last = ((h[n - 2] + h[n - 1]) * moments[-1]
+                - h[n - 1] * moments[-2]) / h[n - 2]
+        return [first] + moments + [last]
+    return _tridiagonal(lower, diagonal, upper, right)
+
+
+_SPLINE_BOUNDARIES = ("natural", "clamped", "not-a-knot")
+
+
+class PiecewisePolynomial:
+    """Function that is a polynomial between each pair of neighbouring
+    knots. The polynomial of piece i is given in powers of (x - x_i).
+    Outside of the knots the first and the last piece are continued.
+    """
+
+    __slots__ = ("_x", "_coefficients")
+
+    def __init__(self, knots: list | tuple, coefficients: list | tuple):
+        """Insert the n + 1 ascending knots and n tuples with the
+        coefficients c_0 + c_1 (x - x_i) + c_2 (x - x_i)^2 + ... of the
+        pieces.
+        """
+        if len(knots) != len(coefficients) + 1 or not coefficients:
+            raise ArgumentError(len(coefficients),
+                                f"{len(knots) - 1} coefficient tuples")
+        self._x = tuple(knots)
+        self._coefficients = tuple([tuple(e) for e in coefficients])
+
+    def __repr__(self):
+        return f"{type(self).__name__}({len(self._coefficients)} pieces " \
+               f"on [{self._x[0]}, {self._x[-1]}])"
+
+    def __len__(self):
+        """Returns the amount of pieces."""
+        return len(self._coefficients)
+
+    def knots(self) -> tuple:
+        """Returns the knots."""
+        return self._x
+
+    def piece(self, index: int) -> 'Polynomial':
+        """Returns the polynomial of a piece in x."""
+        result = Polynomial(0)
+        shift = Polynomial(1, -self._x[index])
+        for c in reversed(self._coefficients[index]):
+            result = result * shift + c
+        return result
+
+    def _find(self, x: REAL) -> int:
+        """Returns the index of the piece of x by binary search."""
+        return min(max(bisect_right(self._x, x) - 1, 0),
+                   len(self._coefficients) - 1)
+
+    def at(self, x: REAL) -> REAL:
+        """Returns the value at x."""
+        i = self._find(x)
+        dx = x - self._x[i]
+        res = 0
+        for c in reversed(self._coefficients[i]):
+            res = res * dx + c
+        return res
+
+    def evaluate(self, values: list | tuple | array) -> list | array:
+        """Returns the values for a sequence of x values. Returns an array
+        if an array is given.
+        """
+        knots, coefficients = self._x, self._coefficients
+        last = len(coefficients) - 1
+
+        def horner(x):
+            i = min(max(bisect_right(knots, x) - 1, 0), last)
+            dx = x - knots[i]
+            res = 0
+            for c in reversed(coefficients[i]):
+                res = res * dx + c
+            return res
+
+        if type(values) == array:
+            return array("d", map(horner, values))
+        return list(map(horner, values))
+
+    def derivative(self,
+                   x: REAL = None,
+                   grade: int = 1) -> REAL | 'PiecewisePolynomial':
+        """Returns the derivative if no x is specified. Else returns the
+        value of the derivative at given x.
+        """
+        coefficients = self._coefficients
         for _ in range(grade):
-            arg_list = []
-            for i, e in enumerate(function):
-                power = function.degree() - i + 1
-                arg_list.append(Fraction(e, power))
-            arg_list.append(0)
-            function = Polynomial(*tuple(arg_list))
-        if not a and b:
+            coefficients = [tuple([k * c for k, c in enumerate(e)][1:])
+                            or (0,) for e in coefficients]
+        function = PiecewisePolynomial(self._x, coefficients)
+        if x is not None:
+            return function.at(x)
+        return function
+
+    def integral(self,
+                 a: REAL = None,
+                 b: REAL = None) -> REAL | 'PiecewisePolynomial':
+        """Returns the antiderivative, which is 0 at the first knot, if no
+        a and b specified. Else returns the integral between a and b.
+        """
+        coefficients, constant = [], 0
+        for i, e in enumerate(self._coefficients):
+            piece = (constant,) + tuple([c / (k + 1)
+                                         for k, c in enumerate(e)])
+            coefficients.append(piece)
+            h, res = self._x[i + 1] - self._x[i], 0
+            for c in reversed(piece):
+                res = res * h + c
+            constant = res
+        function = PiecewisePolynomial(self._x, coefficients)
+        if a is None and b is None:
             return function
-        elif a and b:
-            return function.at(b) - function.at(a)
+        return function.at(b) - function.at(a)
+
+
+class Spline(PiecewisePolynomial):
+    """Cubic spline through points. The boundary conditions are:
+    "natural"     second derivative 0 at the ends
+    "clamped"     given first derivatives (slopes) at the ends
+    "not-a-knot"  third derivative continuous at the second and the
+                  second last knot
+    """
+
+    __slots__ = ()
+
+    def __init__(self,
+                 *args: Point,
+                 boundary: str = "natural",
+                 slopes: tuple = None):
+        """Insert at least two points with different x coordinates. The
+        tridiagonal system for the second derivatives is solved in O(n).
+        """
+        if boundary not in _SPLINE_BOUNDARIES:
+            raise ArgumentError(boundary, _SPLINE_BOUNDARIES)
+        if boundary == "clamped" and (slopes is None or len(slopes) != 2):
+            raise ArgumentError(slopes, "slopes at both ends")
+        if len(args) < 2:
+            raise ArgumentError(len(args), "at least two points")
+        points = sorted(args, key=lambda point: point[0])
+        x = [float(point[0]) for point in points]
+        y = [float(point[-1]) for point in points]
+        for i in range(len(x) - 1):
+            if x[i] == x[i + 1]:
+                raise ArithmeticError("Points with same x coordinate "
+                                      "cannot be processed")
+        moments = _spline_moments(x, y, boundary, slopes)
+        coefficients = []
+        for i in range(len(x) - 1):
+            h = x[i + 1] - x[i]
+            slope = (y[i + 1] - y[i]) / h
+            coefficients.append((
+                y[i],
+                slope - h * (2 * moments[i] + moments[i + 1]) / 6,
+                moments[i] / 2,
+                (moments[i + 1] - moments[i]) / (6 * h)
+            ))
+        super().__init__(x, coefficients)
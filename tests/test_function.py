@@ -0,0 +1,64 @@
+import math
+
+from avmath import Dual
+from avmath.analysis import Function
+
+
+def test_derivative_of_fractional_power_at_zero():
+    f = Function("x^1.5")
+    assert f.derivative(0) == 0
+    assert f.tangent(0).at(1) == 0
+
+
+def test_second_derivative_of_fractional_power_at_zero_is_undefined():
+    assert math.isnan((Dual(0.0, 1) ** 1.5).second)
+
+
+def test_dual_power_away_from_zero():
+    result = Dual(4.0, 1) ** 1.5
+    assert (result.value, result.first, result.second) == (8.0, 3.0, 0.375)
+
+
+def test_factorial_of_large_argument_overflows():
+    try:
+        Function("fac(10^7)").at(3)
+    except OverflowError:
+        return
+    raise AssertionError("fac(10^7) was evaluated")
+
+
+def test_arc_functions_close_to_one():
+    assert abs(Function("arccos(x)").at(0.9999) - math.acos(0.9999)) < 1e-15
+    assert abs(Function("arctan(x)").at(1) - math.atan(1)) < 1e-15
+
+
+def test_derivative_of_root_at_zero_is_infinite():
+    assert Function("x^0.5").derivative(0) == math.inf
+    assert (Dual(0, 1) ** 0.5).first == math.inf
+
+
+def test_derivative_at_kink_and_stationary_points():
+    assert Function("abs(x)").derivative(0) == 0
+    assert Function("x^3").derivative(0) == 0
+    assert Function("x^3").second_derivative(0) == 0
+
+
+def test_solve_finds_all_roots_in_interval():
+    roots = Function("sin(x)").solve(1, 7).value
+    assert len(roots) == 2
+    assert math.isclose(roots[0], math.pi)
+    assert math.isclose(roots[1], 2 * math.pi)
+    result = Function("x^2-2").solve(0, 3)
+    assert math.isclose(result.value[0], 2 ** 0.5)
+    assert result.error < 1e-10
+
+
+def test_integrate():
+    assert math.isclose(Function("x^2").integrate(0, 3).value, 9)
+    assert math.isclose(Function("x^3").integrate(0, 2, "romberg").value, 4)
+    assert math.isclose(Function("x").integrate(2, 0).value, -2)
+
+
+def test_integrate_singularity_at_bound():
+    result = Function("x^(-0.5)").integrate(0, 1, "tanh-sinh")
+    assert math.isclose(result.value, 2)
@@ -0,0 +1,51 @@
+from avmath.algebra import Matrix, SLE, Tuple, Vector
+
+
+def test_views_keep_values_of_their_creation():
+    m = Matrix([1, 2, 3], [4, 5, 6])
+    t = m.transpose()
+    r = m.remove(0)
+    m[0][0] = 100
+    assert t[0] == [1, 4]
+    assert r[0] == [4, 5, 6]
+    assert m[0] == [100, 2, 3]
+
+
+def test_writes_to_views_do_not_change_the_matrix():
+    m = Matrix([1, 2], [3, 4])
+    t = m.transpose()
+    t[0][1] = -1
+    assert t[0] == [1, -1]
+    assert m[0] == [1, 2]
+
+
+def test_rows_of_views_are_lists():
+    t = Matrix([1, 2], [3, 4]).transpose()
+    assert type(t[0]) == list
+    assert t[0].index(3) == 1
+    assert t[1] + [0] == [2, 4, 0]
+
+
+def test_rows_and_columns_pass_type_checks():
+    m = Matrix([1, 2], [3, 4])
+    assert Tuple(m.row(0)) == Tuple(Vector(1, 2))
+    assert m.transpose().column(1) == Vector(3, 4)
+
+
+def test_determinant_of_views():
+    m = Matrix([2, 1, 1, 3], [1, 3, 2, 1], [1, 0, 0, 4], [5, 1, 2, 2])
+    assert m.det() == m.transpose().det() == 1
+    assert m.remove(0, 0).det() == m.cof()[0][0] == -16
+
+
+def test_sle_solve():
+    assert SLE([2, 1, 7], [1, 3, 11]).solve() == Vector(2, 3)
+
+
+def test_views_of_views_keep_values_of_their_creation():
+    m = Matrix([1, 2, 3], [4, 5, 6], [7, 8, 9])
+    minor = m.transpose().remove(0, 0)
+    for row in m:
+        row[1] = 0
+    assert minor[0] == [5, 8]
+    assert minor.det() == 5 * 9 - 8 * 6
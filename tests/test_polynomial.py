@@ -0,0 +1,29 @@
+from avmath.algebra import Matrix
+from avmath.analysis import Polynomial
+
+
+def test_real_double_root_of_float_polynomial():
+    assert Polynomial(1.0, -3.0, 2.25).roots(mode=float) == [1.5, 1.5]
+    assert Polynomial(1.0, -2.0, 1.0).roots(mode=float) == [1.0, 1.0]
+
+
+def test_real_triple_root_of_float_polynomial():
+    assert Polynomial(1.0, -3, 3, -1).roots(mode=float) == [1.0, 1.0, 1.0]
+
+
+def test_eigenvalues_of_float_matrix_with_double_eigenvalue():
+    assert Matrix([1.5, 0], [0, 1.5]).eigenvalues(mode=float) == [1.5, 1.5]
+
+
+def test_complex_roots_close_to_double_root_are_not_real():
+    assert Polynomial(1.0, -2, 1.000001).roots(mode=float) == []
+
+
+def test_exact_repeated_roots():
+    assert Polynomial(1, -4, 5, -2).roots() == [1, 1, 2]
+    assert Polynomial(1, -4, 5, -2).roots(mode=float) == [1.0, 1.0, 2.0]
+
+
+def test_roots_without_real_solutions():
+    assert Polynomial(1, 0, 1).roots() == [-1j, 1j]
+    assert Polynomial(1, 0, 1).roots(mode=float) == []
@@ -0,0 +1,33 @@
+import math
+
+from avmath.analysis import Point, Spline
+
+
+def test_natural_spline_interpolates_points():
+    spline = Spline(Point(0, 0), Point(1, 1), Point(2, 0), Point(3, 1))
+    for x, y in enumerate([0, 1, 0, 1]):
+        assert math.isclose(spline.at(x), y, abs_tol=1e-12)
+    assert spline.derivative(0, 2) == 0
+    assert math.isclose(spline.derivative(3, 2), 0, abs_tol=1e-12)
+
+
+def test_not_a_knot_spline_reproduces_cubic():
+    spline = Spline(Point(0, 0), Point(1, 1), Point(2, 8), Point(3, 27),
+                    boundary="not-a-knot")
+    assert math.isclose(spline.at(1.5), 1.5 ** 3)
+    assert math.isclose(spline.at(2.5), 2.5 ** 3)
+
+
+def test_clamped_spline_has_given_slopes():
+    spline = Spline(Point(0, 0), Point(1, 1), boundary="clamped",
+                    slopes=(0, 0))
+    assert spline.derivative(0) == spline.derivative(1) == 0
+    assert spline.at(0.5) == 0.5
+
+
+def test_spline_rejects_points_with_same_x():
+    try:
+        Spline(Point(0, 0), Point(0, 1))
+    except ArithmeticError:
+        return
+    raise AssertionError("points with same x were accepted")
@@ -0,0 +1,14 @@
+from avmath.algebra import Vector, VectorArray
+
+
+def test_cross_with_single_vector():
+    va = VectorArray(Vector(1, 0, 0), Vector(0, 1, 0), Vector(1, 1, 0))
+    res = va.cross(Vector(0, 0, 1))
+    assert len(res) == 3
+    assert [list(e) for e in res] == [[0, -1, 0], [1, 0, 0], [1, -1, 0]]
+
+
+def test_spat_with_single_vectors():
+    va = VectorArray(Vector(1, 0, 0), Vector(0, 1, 0), Vector(1, 1, 0))
+    res = VectorArray.spat(va, Vector(0, 0, 1), Vector(1, 1, 1))
+    assert list(res) == [-1, 1, 0]